@@ -1,30 +1,53 @@
 import dash
-from dash import dcc, html, Input, Output, callback, State, ALL
+from dash import dcc, html, Input, Output, callback, State, ALL, ClientsideFunction, Patch
 import dash_bootstrap_components as dbc
+from flask_caching import Cache
+from cachetools import TTLCache
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from functools import lru_cache
 import random
-import math
 import os
+import time
 import json
 import hashlib
 import base64
 from urllib.parse import parse_qs
+import threading
 import io
+import itertools
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.colors import HexColor
 import plotly.io as pio
+import numpy as np
+
+# Backdrop blur is expensive to paint, so assets/blur.css is only served when opted in
+ENABLE_BLUR = os.environ.get("LEXCURA_BLUR", "0") == "1"
 
 # Initialize the Dash app with Bootstrap theme
 app = dash.Dash(__name__, 
-                external_stylesheets=[dbc.themes.BOOTSTRAP],
+                assets_ignore='' if ENABLE_BLUR else r'blur\.css',
+                external_stylesheets=[
+                    dbc.themes.BOOTSTRAP,
+                    'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap',
+                    'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css'
+                ],
                 suppress_callback_exceptions=True,
+                compress=True,  # gzip/brotli for callbacks, HTML and assets (Flask-Compress)
                 meta_tags=[{"name": "viewport", "content": "width=device-width, initial-scale=1"}])
 
 server = app.server
 
+# Layout and figure cache. Each gunicorn worker varies its own in-memory `data`, so entries
+# must never be shared between processes - an in-memory SimpleCache per worker, which
+# preloaded workers start from the master's copy of
+cache = Cache(server, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 300
+})
+
 # Authentication configuration
 USERS = {
     "admin": "dashboard2024",  # Simple test credentials
@@ -43,8 +66,24 @@ COLORS = {
     'warning_orange': '#F4A261'
 }
 
-# Session store for authentication
-session_store = {}
+# Shared component styles
+GOLD_BORDER = f'1px solid {COLORS["gold_primary"]}'
+CARD_BOX_STYLE = {'background-color': COLORS['dark_grey'], 'border': GOLD_BORDER}
+SIDEBAR_CARD_STYLE = {**CARD_BOX_STYLE, 'margin': '20px 10px', 'border-radius': '10px'}
+NEUTRAL_STYLE = {'color': COLORS['neutral_text']}
+
+def neutral_p(text):
+    """Paragraph in the standard neutral body text color"""
+    return html.P(text, style=NEUTRAL_STYLE)
+
+# Shared dcc.Graph configs - no mode bar toolbar is built for any chart
+GRAPH_CONFIG = {'displayModeBar': False, 'responsive': True, 'staticPlot': False}
+GRAPH_CONFIG_STATIC = {**GRAPH_CONFIG, 'staticPlot': True}
+
+# Session store for authentication - entries expire after an hour so abandoned sessions don't pile up
+session_store = TTLCache(maxsize=10_000, ttl=3600)
+# TTLCache is not thread-safe and gthread workers serve several callbacks at once
+_session_store_lock = threading.Lock()
 
 def generate_session_id():
     """Generate a secure session ID"""
@@ -64,26 +103,35 @@ def is_authenticated(session_data, user_data=None):
         if session_data.get('authenticated') == True:
             return True
         session_id = session_data.get('session_id')
-        if session_id and session_id in session_store:
-            return True
+        if session_id:
+            with _session_store_lock:
+                if session_id in session_store:
+                    return True
     
     # Check user data
     if user_data:
         session_id = user_data.get('session_id')
-        if session_id and session_id in session_store:
-            return True
+        if session_id:
+            with _session_store_lock:
+                if session_id in session_store:
+                    return True
     
     return False
 
+def _frozen(array):
+    """Mark a NumPy array read-only so a data snapshot can't be changed in place"""
+    array.flags.writeable = False
+    return array
+
 # Enhanced data generation with better error handling
 def generate_sample_data():
     try:
-        random.seed(42)
+        rng = np.random.default_rng(42)
         
-        # Financial data
+        # Financial data - current period is an array so refreshes can vary it in one step
         financial_data = {
             'categories': ['Revenue', 'Operating Costs', 'Net Profit', 'Investments', 'Returns'],
-            'current': [2850000, -1320000, 1530000, -480000, 720000],
+            'current': _frozen(np.array([2850000, -1320000, 1530000, -480000, 720000], dtype=np.int64)),
             'previous': [2600000, -1450000, 1150000, -520000, 580000]
         }
         
@@ -100,6 +148,7 @@ def generate_sample_data():
             'severity': ['Critical', 'Warning', 'Info'],
             'count': [8, 24, 42]
         }
+        alert_data['total'] = sum(alert_data['count'])
         
         # Historical data
         end_date = datetime.now()
@@ -111,13 +160,11 @@ def generate_sample_data():
             current_date += timedelta(days=1)
         
         base_value = 1000
-        historical_performance = []
-        for i, date in enumerate(historical_dates):
-            trend = (i / len(historical_dates)) * 200
-            seasonal = 100 * math.sin(2 * math.pi * i / 365)
-            noise = random.uniform(-50, 50)
-            value = base_value + trend + seasonal + noise
-            historical_performance.append(value)
+        day_index = np.arange(len(historical_dates))
+        trend = (day_index / len(historical_dates)) * 200
+        seasonal = 100 * np.sin(2 * np.pi * day_index / 365)
+        noise = rng.uniform(-50, 50, len(historical_dates))
+        historical_performance = base_value + trend + seasonal + noise
         
         historical_data = {
             'dates': historical_dates,
@@ -205,9 +252,9 @@ def generate_sample_data():
         print(f"Critical error in data generation: {str(e)}")
         # Minimal fallback data
         return {
-            'financial': {'categories': ['Revenue'], 'current': [1000000], 'previous': [900000]},
+            'financial': {'categories': ['Revenue'], 'current': _frozen(np.array([1000000], dtype=np.int64)), 'previous': [900000]},
             'deadlines': {'tasks': ['Sample Task'], 'days_left': [5], 'progress': [50], 'urgency': ['Normal']},
-            'alerts': {'severity': ['Info'], 'count': [10]},
+            'alerts': {'severity': ['Info'], 'count': [10], 'total': 10},
             'historical': {'dates': [datetime.now()], 'performance': [1000], 'target': 1200},
             'growth': {'months': ['Jan'], 'growth_rate': [15], 'decline_rate': [5]},
             'performance': {'kpis': ['Performance'], 'current_score': [80], 'target_score': [90], 'industry_avg': [75]},
@@ -216,8 +263,14 @@ def generate_sample_data():
             'archive': []
         }
 
-# Initialize data
-data = generate_sample_data()
+# Current data snapshot. It is never modified in place - refreshes build a new dict
+# (copy-on-write, see vary_data) and swap the reference, so readers need no lock.
+# `versions` holds, for each chart whose data varies at runtime, the snapshot version
+# that last changed it; charts missing from it read constant data
+data = {**generate_sample_data(), 'versions': {'financial': 0, 'risk': 0}}
+_data_lock = threading.Lock()
+# Monotonically increasing snapshot versions, drawn by vary_data under _data_lock
+_data_versions = itertools.count(1)
 
 def get_base_layout(title):
     return {
@@ -239,52 +292,51 @@ def get_base_layout(title):
             'borderwidth': 1
         },
         'xaxis': {'color': COLORS['neutral_text'], 'gridcolor': '#2A2D30'},
-        'yaxis': {'color': COLORS['neutral_text'], 'gridcolor': '#2A2D30'}
+        'yaxis': {'color': COLORS['neutral_text'], 'gridcolor': '#2A2D30'},
+        # No animation tweens, and keep zoom/pan state across data refreshes
+        'transition': {'duration': 0},
+        'uirevision': 'static'
     }
 
 # Enhanced chart creation with animations
-def create_financial_chart():
+def create_financial_chart(state):
     try:
-        fig = go.Figure()
-        
-        colors_current = [COLORS['success_green'] if x > 0 else COLORS['danger_red'] for x in data['financial']['current']]
+        colors_current = [COLORS['success_green'] if x > 0 else COLORS['danger_red'] for x in state['financial']['current']]
         
-        fig.add_trace(go.Bar(
-            x=data['financial']['categories'],
-            y=data['financial']['current'],
+        current_trace = go.Bar(
+            x=state['financial']['categories'],
+            y=state['financial']['current'].astype(np.int32),
             name='Current Period',
             marker_color=colors_current,
             hovertemplate='<b>%{x}</b><br>Current: $%{y:,.0f}<br><extra></extra>',
-            text=[f"${x:,.0f}" for x in data['financial']['current']],
+            text=[f"${x:,.0f}" for x in state['financial']['current']],
             textposition='outside',
             marker_line=dict(color='rgba(255,255,255,0.3)', width=1)
-        ))
+        )
         
-        fig.add_trace(go.Bar(
-            x=data['financial']['categories'],
-            y=data['financial']['previous'],
+        previous_trace = go.Bar(
+            x=state['financial']['categories'],
+            y=np.asarray(state['financial']['previous'], dtype=np.int32),
             name='Previous Period',
             marker_color=COLORS['gold_primary'],
             opacity=0.7,
             hovertemplate='<b>%{x}</b><br>Previous: $%{y:,.0f}<br><extra></extra>',
             marker_line=dict(color='rgba(255,255,255,0.2)', width=1)
-        ))
+        )
         
         layout = get_base_layout('Financial Impact Analysis')
         layout['yaxis']['tickformat'] = '$,.0f'
         layout['barmode'] = 'group'
-        layout['transition'] = {'duration': 800, 'easing': 'cubic-in-out'}
         
-        fig.update_layout(layout)
-        return fig
+        # Layout goes through the constructor so it is validated only once
+        return go.Figure(data=[current_trace, previous_trace], layout=layout)
     except Exception as e:
         print(f"Error in financial chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Financial Impact Analysis'))
         fig.add_annotation(text="Financial Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Financial Impact Analysis'))
         return fig
 
-def create_deadline_chart():
+def create_deadline_chart(state):
     try:
         urgency_colors = {
             'Critical': COLORS['danger_red'],
@@ -292,85 +344,82 @@ def create_deadline_chart():
             'Normal': COLORS['success_green']
         }
         
-        fig = go.Figure()
+        colors = [urgency_colors.get(urgency, COLORS['neutral_text']) for urgency in state['deadlines']['urgency']]
         
-        colors = [urgency_colors.get(urgency, COLORS['neutral_text']) for urgency in data['deadlines']['urgency']]
-        
-        fig.add_trace(go.Bar(
-            x=data['deadlines']['days_left'],
-            y=data['deadlines']['tasks'],
+        trace = go.Bar(
+            x=state['deadlines']['days_left'],
+            y=state['deadlines']['tasks'],
             orientation='h',
             marker_color=colors,
             hovertemplate='<b>%{y}</b><br>Days Remaining: %{x}<br>Progress: %{customdata}%<br><extra></extra>',
-            customdata=data['deadlines']['progress'],
-            text=[f"{days}d" for days in data['deadlines']['days_left']],
+            customdata=state['deadlines']['progress'],
+            text=[f"{days}d" for days in state['deadlines']['days_left']],
             textposition='middle right'
-        ))
+        )
         
         layout = get_base_layout('Project Deadline Tracker')
         layout['xaxis']['title'] = 'Days Remaining'
         layout['height'] = 400
         
-        fig.update_layout(layout)
-        return fig
+        return go.Figure(data=[trace], layout=layout)
     except Exception as e:
         print(f"Error in deadline chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Project Deadline Tracker'))
         fig.add_annotation(text="Deadline Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Project Deadline Tracker'))
         return fig
 
-def create_alert_chart():
+def create_alert_chart(state):
     try:
         severity_colors = [COLORS['danger_red'], COLORS['warning_orange'], COLORS['success_green']]
         
-        fig = go.Figure(go.Pie(
-            labels=data['alerts']['severity'],
-            values=data['alerts']['count'],
+        trace = go.Pie(
+            labels=state['alerts']['severity'],
+            values=state['alerts']['count'],
             hole=0.6,
             marker_colors=severity_colors,
             hovertemplate='<b>%{label} Alerts</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>',
             textinfo='label+percent',
             textfont={'color': 'white', 'size': 12}
-        ))
-        
-        total_alerts = sum(data['alerts']['count'])
-        fig.add_annotation(
-            text=f"Total<br><b>{total_alerts}</b><br>Alerts",
-            x=0.5, y=0.5,
-            font={'size': 16, 'color': COLORS['neutral_text']},
-            showarrow=False
         )
         
+        total_alerts = state['alerts']['total']
+        
         layout = get_base_layout('Alert Severity Distribution')
         layout['showlegend'] = False
-        
-        fig.update_layout(layout)
-        return fig
+        layout['annotations'] = [{
+            'text': f"Total<br><b>{total_alerts}</b><br>Alerts",
+            'x': 0.5, 'y': 0.5,
+            'font': {'size': 16, 'color': COLORS['neutral_text']},
+            'showarrow': False
+        }]
+        
+        return go.Figure(data=[trace], layout=layout)
     except Exception as e:
         print(f"Error in alert chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Alert Severity Distribution'))
         fig.add_annotation(text="Alert Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Alert Severity Distribution'))
         return fig
 
-def create_historical_chart():
+def create_historical_chart(state):
     try:
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=data['historical']['dates'],
-            y=data['historical']['performance'],
+        trace = go.Scattergl(
+            x=state['historical']['dates'],
+            y=np.asarray(state['historical']['performance'], dtype=np.float32),
             mode='lines',
             line={'color': COLORS['gold_primary'], 'width': 3},
             fill='tonexty',
             fillcolor=f"rgba(212, 175, 55, 0.3)",
             name='Performance Metric',
             hovertemplate='<b>%{x|%Y-%m-%d}</b><br>Performance: %{y:,.1f}<extra></extra>'
-        ))
+        )
+        
+        layout = get_base_layout('Historical Performance Trends')
+        layout['xaxis']['title'] = 'Date'
+        layout['yaxis']['title'] = 'Performance Score'
         
+        fig = go.Figure(data=[trace], layout=layout)
         fig.add_hline(
-            y=data['historical']['target'],
+            y=state['historical']['target'],
             line_dash="dash",
             line_color=COLORS['success_green'],
             line_width=2,
@@ -378,91 +427,79 @@ def create_historical_chart():
             annotation_position="top right"
         )
         
-        layout = get_base_layout('Historical Performance Trends')
-        layout['xaxis']['title'] = 'Date'
-        layout['yaxis']['title'] = 'Performance Score'
-        
-        fig.update_layout(layout)
         return fig
     except Exception as e:
         print(f"Error in historical chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Historical Performance Trends'))
         fig.add_annotation(text="Historical Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Historical Performance Trends'))
         return fig
 
-def create_growth_chart():
+def create_growth_chart(state):
     try:
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=data['growth']['months'],
-            y=data['growth']['growth_rate'],
+        growth_trace = go.Bar(
+            x=state['growth']['months'],
+            y=state['growth']['growth_rate'],
             name='Growth Rate',
             marker_color=COLORS['success_green'],
             hovertemplate='<b>%{x}</b><br>Growth: +%{y}%<extra></extra>',
-            text=[f"+{rate}%" for rate in data['growth']['growth_rate']],
+            text=[f"+{rate}%" for rate in state['growth']['growth_rate']],
             textposition='outside'
-        ))
+        )
         
-        decline_negative = [-rate for rate in data['growth']['decline_rate']]
-        fig.add_trace(go.Bar(
-            x=data['growth']['months'],
+        decline_negative = [-rate for rate in state['growth']['decline_rate']]
+        decline_trace = go.Bar(
+            x=state['growth']['months'],
             y=decline_negative,
             name='Decline Rate',
             marker_color=COLORS['danger_red'],
             hovertemplate='<b>%{x}</b><br>Decline: %{y}%<extra></extra>',
-            text=[f"-{rate}%" for rate in data['growth']['decline_rate']],
+            text=[f"-{rate}%" for rate in state['growth']['decline_rate']],
             textposition='outside'
-        ))
+        )
         
         layout = get_base_layout('Growth vs Decline Analysis')
         layout['yaxis']['title'] = 'Rate (%)'
         layout['yaxis']['ticksuffix'] = '%'
         layout['xaxis']['title'] = 'Month'
         
-        fig.update_layout(layout)
-        return fig
+        return go.Figure(data=[growth_trace, decline_trace], layout=layout)
     except Exception as e:
         print(f"Error in growth chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Growth vs Decline Analysis'))
         fig.add_annotation(text="Growth Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Growth vs Decline Analysis'))
         return fig
 
-def create_performance_chart():
+def create_performance_chart(state):
     try:
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatterpolar(
-            r=data['performance']['current_score'],
-            theta=data['performance']['kpis'],
+        current_trace = go.Scatterpolar(
+            r=state['performance']['current_score'],
+            theta=state['performance']['kpis'],
             fill='toself',
             name='Current Performance',
             line_color=COLORS['gold_primary'],
             fillcolor=f"rgba(212, 175, 55, 0.4)",
             hovertemplate='<b>%{theta}</b><br>Current: %{r}%<extra></extra>'
-        ))
+        )
         
-        fig.add_trace(go.Scatterpolar(
-            r=data['performance']['target_score'],
-            theta=data['performance']['kpis'],
+        target_trace = go.Scatterpolar(
+            r=state['performance']['target_score'],
+            theta=state['performance']['kpis'],
             fill='toself',
             name='Target',
             line_color=COLORS['success_green'],
             fillcolor=f"rgba(61, 188, 107, 0.2)",
             hovertemplate='<b>%{theta}</b><br>Target: %{r}%<extra></extra>'
-        ))
+        )
         
-        fig.add_trace(go.Scatterpolar(
-            r=data['performance']['industry_avg'],
-            theta=data['performance']['kpis'],
+        industry_trace = go.Scatterpolar(
+            r=state['performance']['industry_avg'],
+            theta=state['performance']['kpis'],
             mode='lines',
             name='Industry Average',
             line_color=COLORS['neutral_text'],
             line_dash='dot',
             hovertemplate='<b>%{theta}</b><br>Industry Avg: %{r}%<extra></extra>'
-        ))
+        )
         
         layout = get_base_layout('Performance vs Target KPIs')
         layout['polar'] = {
@@ -475,27 +512,25 @@ def create_performance_chart():
             'angularaxis': {'color': COLORS['neutral_text']}
         }
         
-        fig.update_layout(layout)
-        return fig
+        return go.Figure(data=[current_trace, target_trace, industry_trace], layout=layout)
     except Exception as e:
         print(f"Error in performance chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('Performance vs Target KPIs'))
         fig.add_annotation(text="Performance Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('Performance vs Target KPIs'))
         return fig
 
-def create_risk_gauge():
+def create_risk_gauge(state):
     try:
-        if data['risk_score'] <= 30:
+        if state['risk_score'] <= 30:
             gauge_color = COLORS['success_green']
-        elif data['risk_score'] <= 70:
+        elif state['risk_score'] <= 70:
             gauge_color = COLORS['warning_orange']
         else:
             gauge_color = COLORS['danger_red']
         
-        fig = go.Figure(go.Indicator(
+        trace = go.Indicator(
             mode="gauge+number+delta",
-            value=data['risk_score'],
+            value=state['risk_score'],
             domain={'x': [0, 1], 'y': [0, 1]},
             title={'text': "Risk & Compliance Score", 'font': {'color': COLORS['neutral_text'], 'size': 16}},
             delta={
@@ -522,82 +557,202 @@ def create_risk_gauge():
                 }
             },
             number={'font': {'color': COLORS['neutral_text'], 'size': 24}}
-        ))
-        
-        fig.update_layout(
-            paper_bgcolor=COLORS['charcoal'],
-            plot_bgcolor=COLORS['charcoal'],
-            font={'color': COLORS['neutral_text'], 'family': 'Inter'},
-            margin={'l': 40, 'r': 40, 't': 60, 'b': 40},
-            height=400
         )
         
-        return fig
+        layout = {
+            'paper_bgcolor': COLORS['charcoal'],
+            'plot_bgcolor': COLORS['charcoal'],
+            'font': {'color': COLORS['neutral_text'], 'family': 'Inter'},
+            'margin': {'l': 40, 'r': 40, 't': 60, 'b': 40},
+            'height': 400
+        }
+        
+        return go.Figure(data=[trace], layout=layout)
     except Exception as e:
         print(f"Error in risk gauge: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout={
+            'paper_bgcolor': COLORS['charcoal'],
+            'plot_bgcolor': COLORS['charcoal'],
+            'font': {'color': COLORS['neutral_text'], 'family': 'Inter'},
+            'height': 400
+        })
         fig.add_annotation(text="Risk Gauge Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(
-            paper_bgcolor=COLORS['charcoal'],
-            plot_bgcolor=COLORS['charcoal'],
-            font={'color': COLORS['neutral_text'], 'family': 'Inter'},
-            height=400
-        )
         return fig
 
-def create_projection_chart():
+def create_projection_chart(state):
     try:
-        fig = go.Figure()
+        upper = np.asarray(state['projections']['upper_confidence'], dtype=np.float32)
         
-        fig.add_trace(go.Scatter(
-            x=data['projections']['dates'],
-            y=data['projections']['upper_confidence'],
+        upper_trace = go.Scattergl(
+            x=state['projections']['dates'],
+            y=upper,
             mode='lines',
             line={'width': 0},
             showlegend=False,
             hoverinfo='skip',
             name='Upper Bound'
-        ))
+        )
         
-        fig.add_trace(go.Scatter(
-            x=data['projections']['dates'],
-            y=data['projections']['lower_confidence'],
+        lower_trace = go.Scattergl(
+            x=state['projections']['dates'],
+            y=np.asarray(state['projections']['lower_confidence'], dtype=np.float32),
             mode='lines',
             line={'width': 0},
             fill='tonexty',
             fillcolor='rgba(212, 175, 55, 0.2)',
             name='Confidence Interval',
             hovertemplate='<b>%{x|%Y-%m}</b><br>Range: $%{y:,.0f} - $%{customdata:,.0f}<extra></extra>',
-            customdata=data['projections']['upper_confidence']
-        ))
+            customdata=upper
+        )
         
-        fig.add_trace(go.Scatter(
-            x=data['projections']['dates'],
-            y=data['projections']['forecast'],
+        forecast_trace = go.Scattergl(
+            x=state['projections']['dates'],
+            y=np.asarray(state['projections']['forecast'], dtype=np.float32),
             mode='lines+markers',
             line={'color': COLORS['gold_primary'], 'width': 4},
             marker={'size': 8, 'color': COLORS['highlight_gold']},
             name='Revenue Forecast',
             hovertemplate='<b>%{x|%Y-%m}</b><br>Forecast: $%{y:,.0f}<extra></extra>'
-        ))
+        )
         
         layout = get_base_layout('12-Month Revenue Projection')
         layout['xaxis']['title'] = 'Month'
         layout['yaxis']['title'] = 'Revenue ($)'
         layout['yaxis']['tickformat'] = '$,.0f'
         
-        fig.update_layout(layout)
-        return fig
+        return go.Figure(data=[upper_trace, lower_trace, forecast_trace], layout=layout)
     except Exception as e:
         print(f"Error in projection chart: {str(e)}")
-        fig = go.Figure()
+        fig = go.Figure(layout=get_base_layout('12-Month Revenue Projection'))
         fig.add_annotation(text="Projection Chart Error - Please Refresh", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(get_base_layout('12-Month Revenue Projection'))
         return fig
 
+# Chart builders in dashboard grid order - numeric series go into traces as float32/int32
+# arrays, which serialize with far fewer digits than float64 values
+CHART_BUILDERS = {
+    'financial': create_financial_chart,
+    'deadline': create_deadline_chart,
+    'alert': create_alert_chart,
+    'historical': create_historical_chart,
+    'growth': create_growth_chart,
+    'performance': create_performance_chart,
+    'risk': create_risk_gauge,
+    'projection': create_projection_chart
+}
+
+# Serialized figures shared by every layout and callback
+STATIC_FIGS = {}
+
+# Data version each STATIC_FIGS entry was built from (see data['versions'])
+STATIC_FIG_VERSIONS = {}
+
+def serialize_chart(name, state):
+    """Serialized figure for a chart"""
+    return json.loads(pio.to_json(CHART_BUILDERS[name](state), validate=False))
+
+def build_static_figs(names=CHART_BUILDERS, state=None):
+    """Rebuild and serialize the named charts from a data snapshot (the current one by default)
+    
+    Charts already built from this version of their data (or a newer one) are skipped.
+    A chart that fails keeps its last good figure (or the empty placeholder).
+    """
+    state = data if state is None else state
+    built = False
+    for name in names:
+        version = state['versions'].get(name, 0)
+        if name in STATIC_FIG_VERSIONS and STATIC_FIG_VERSIONS[name] >= version:
+            continue
+        try:
+            STATIC_FIGS[name] = serialize_chart(name, state)
+            STATIC_FIG_VERSIONS[name] = version
+            built = True
+        except Exception as e:
+            print(f"Error building {name} chart: {str(e)}")
+            STATIC_FIGS.setdefault(name, LAZY_PLACEHOLDER)
+    # The cached grid holds these figures
+    if built:
+        get_dashboard_grid.cache_clear()
+
+# Below-the-fold dashboard charts, drawn by the browser once scrolled into view
+LAZY_GRAPHS = {
+    'historical-trends-chart': 'historical',
+    'growth-decline-chart': 'growth',
+    'performance-comparison-chart': 'performance',
+    'risk-compliance-gauge': 'risk',
+    'projection-forecast-chart': 'projection'
+}
+
+# Empty figure shown until a lazy chart is filled in
+LAZY_PLACEHOLDER = {
+    'data': [],
+    'layout': {
+        'paper_bgcolor': COLORS['charcoal'],
+        'plot_bgcolor': COLORS['charcoal'],
+        'xaxis': {'visible': False},
+        'yaxis': {'visible': False}
+    }
+}
+
+# Dashboard grid cards in display order - (graph id, chart name)
+DASHBOARD_GRID = [
+    ('financial-impact-chart', 'financial'),
+    ('deadline-tracker-chart', 'deadline'),
+    ('alert-severity-chart', 'alert'),
+    ('historical-trends-chart', 'historical'),
+    ('growth-decline-chart', 'growth'),
+    ('performance-comparison-chart', 'performance'),
+    ('risk-compliance-gauge', 'risk'),
+    ('projection-forecast-chart', 'projection')
+]
+
+# Above-the-fold charts, which refresh callbacks update directly
+EAGER_GRAPHS = [(graph_id, name) for graph_id, name in DASHBOARD_GRID if graph_id not in LAZY_GRAPHS]
+
+# Every refresh callback writes the eager graphs, the lazy-figures store and figure-versions
+REFRESH_OUTPUT_COUNT = len(EAGER_GRAPHS) + 2
+
+def refreshed_figures(sent_versions):
+    """Refresh callback outputs for the charts this browser has not been sent yet
+    
+    sent_versions is the browser's figure-versions store - the data version of every
+    figure it was last sent. Eager charts get their new figure directly. Lazy charts are
+    updated through the lazy-figures store, so an offscreen chart is not drawn until it
+    scrolls into view and the store never holds an older figure than the one on screen.
+    """
+    sent_versions = sent_versions or {}
+    versions = dict(STATIC_FIG_VERSIONS)
+    changed = {name for name, version in versions.items() if sent_versions.get(name) != version}
+    if not changed:
+        return [dash.no_update] * REFRESH_OUTPUT_COUNT
+    figures = [STATIC_FIGS[name] if name in changed else dash.no_update for _, name in EAGER_GRAPHS]
+    lazy_changed = {graph_id: name for graph_id, name in LAZY_GRAPHS.items() if name in changed}
+    if not lazy_changed:
+        return [*figures, dash.no_update, versions]
+    lazy = Patch()
+    for graph_id, name in lazy_changed.items():
+        lazy[graph_id] = STATIC_FIGS[name]
+    return [*figures, lazy, versions]
+
+@lru_cache(maxsize=1)
+def get_dashboard_grid():
+    """Chart cards for the dashboard grid, rebuilt only when the figures change"""
+    return [
+        html.Div([
+            dcc.Loading([
+                dcc.Graph(
+                    id=graph_id,
+                    figure=LAZY_PLACEHOLDER if graph_id in LAZY_GRAPHS else STATIC_FIGS[name],
+                    config=GRAPH_CONFIG_STATIC if name == 'risk' else GRAPH_CONFIG,
+                    style={'height': '420px'}
+                )
+            ], color=COLORS['gold_primary'])
+        ], className="card", **({'data-lazy-graph': graph_id} if graph_id in LAZY_GRAPHS else {}))
+        for graph_id, name in DASHBOARD_GRID
+    ]
+
 # PDF Report Generation
-def generate_pdf_report():
-    """Generate a PDF report of dashboard data"""
+def generate_pdf_report(state):
+    """Generate a PDF report of a data snapshot and return it as bytes, or None on failure"""
     try:
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
@@ -623,8 +778,8 @@ def generate_pdf_report():
         story.append(Paragraph("Financial Summary", styles['Heading2']))
         financial_data_table = [
             ['Category', 'Current Period', 'Previous Period', 'Change'],
-            ['Revenue', f"${data['financial']['current'][0]:,.0f}", f"${data['financial']['previous'][0]:,.0f}", 
-             f"{((data['financial']['current'][0] - data['financial']['previous'][0]) / data['financial']['previous'][0] * 100):.1f}%"]
+            ['Revenue', f"${state['financial']['current'][0]:,.0f}", f"${state['financial']['previous'][0]:,.0f}", 
+             f"{((state['financial']['current'][0] - state['financial']['previous'][0]) / state['financial']['previous'][0] * 100):.1f}%"]
         ]
         
         table = Table(financial_data_table)
@@ -644,16 +799,38 @@ def generate_pdf_report():
         
         # Risk Score
         story.append(Paragraph("Risk Assessment", styles['Heading2']))
-        story.append(Paragraph(f"Current Risk Score: {data['risk_score']}/100", styles['Normal']))
+        story.append(Paragraph(f"Current Risk Score: {state['risk_score']}/100", styles['Normal']))
         
         doc.build(story)
-        buffer.seek(0)
-        return buffer
+        return buffer.getvalue()
         
     except Exception as e:
         print(f"Error generating PDF: {str(e)}")
         return None
 
+# Last generated PDF, reused by every download button while its data is unchanged.
+# A dcc.Download always carries the whole document base64-encoded in the callback
+# response, so it is kept in memory rather than in a temp file
+PDF_CACHE_TTL = 30  # seconds
+_pdf_cache = {'versions': None, 'pdf': None, 't': 0}
+# Serializes check-generate-swap, so concurrent misses generate one PDF and the rest reuse it
+_pdf_lock = threading.Lock()
+
+def _cached_pdf():
+    """Return a PDF of the current data as bytes, regenerated at most every PDF_CACHE_TTL seconds"""
+    with _pdf_lock:
+        state = data
+        now = time.time()
+        if _pdf_cache['versions'] == state['versions'] and now - _pdf_cache['t'] < PDF_CACHE_TTL:
+            return _pdf_cache['pdf']
+        
+        # Only a complete document is cached - a failed build leaves the last good one
+        pdf = generate_pdf_report(state)
+        if pdf is None:
+            return None
+        _pdf_cache.update(versions=state['versions'], pdf=pdf, t=now)
+        return pdf
+
 # Login page layout with animations
 def get_login_layout():
     return dbc.Container([
@@ -703,284 +880,277 @@ def get_login_layout():
 # Analytics page layout - Different view of the same data
 def get_analytics_layout():
     return html.Div([
-        get_sidebar(),
-        html.Div([
-            get_header("Advanced Analytics"),
-            dbc.Container([
-                # Key Metrics Cards
-                dbc.Row([
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H4("$2.85M", className="text-warning"),
-                                html.P("Total Revenue", className="card-text")
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=3),
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H4("68", className="text-danger"),
-                                html.P("Risk Score", className="card-text")
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=3),
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H4("74", className="text-info"),
-                                html.P("Total Alerts", className="card-text")
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=3),
-                    dbc.Col([
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H4("85%", className="text-success"),
-                                html.P("Avg Performance", className="card-text")
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=3)
-                ], className="mb-4"),
-                
-                # Analytics Charts
-                dbc.Row([
-                    dbc.Col([
-                        html.Div([
-                            dcc.Graph(
-                                id='analytics-financial-chart',
-                                figure=create_financial_chart(),
-                                config={'displayModeBar': True, 'responsive': True},
-                                style={'height': '400px'}
-                            )
-                        ], className="card")
-                    ], width=6),
-                    dbc.Col([
-                        html.Div([
-                            dcc.Graph(
-                                id='analytics-performance-chart',
-                                figure=create_performance_chart(),
-                                config={'displayModeBar': True, 'responsive': True},
-                                style={'height': '400px'}
-                            )
-                        ], className="card")
-                    ], width=6)
-                ])
-            ], fluid=True)
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+        get_header("Advanced Analytics"),
+        dbc.Container([
+            # Key Metrics Cards
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H4("$2.85M", className="text-warning"),
+                            html.P("Total Revenue", className="card-text")
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=3),
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H4("68", className="text-danger"),
+                            html.P("Risk Score", className="card-text")
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=3),
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H4("74", className="text-info"),
+                            html.P("Total Alerts", className="card-text")
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=3),
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H4("85%", className="text-success"),
+                            html.P("Avg Performance", className="card-text")
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=3)
+            ], className="mb-4"),
+            
+            # Analytics Charts
+            dbc.Row([
+                dbc.Col([
+                    html.Div([
+                        dcc.Graph(
+                            id='analytics-financial-chart',
+                            figure=STATIC_FIGS['financial'],
+                            config=GRAPH_CONFIG,
+                            style={'height': '400px'}
+                        )
+                    ], className="card")
+                ], width=6),
+                dbc.Col([
+                    html.Div([
+                        dcc.Graph(
+                            id='analytics-performance-chart',
+                            figure=STATIC_FIGS['performance'],
+                            config=GRAPH_CONFIG,
+                            style={'height': '400px'}
+                        )
+                    ], className="card")
+                ], width=6)
+            ])
+        ], fluid=True)
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
 
 # Reports page layout
 def get_reports_layout():
+    now = datetime.now()
     return html.Div([
-        get_sidebar(),
-        html.Div([
-            get_header("Reports & Exports"),
-            dbc.Container([
-                dbc.Row([
-                    dbc.Col([
-                        html.H3("Generate Reports", style={'color': COLORS['gold_primary']}),
-                        html.P("Create and download professional reports", style={'color': COLORS['neutral_text']}),
-                        html.Hr(style={'border-color': COLORS['gold_primary']}),
-                        
-                        # Report Options
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H5("Available Reports"),
-                                dbc.ButtonGroup([
-                                    dbc.Button("Executive Summary PDF", id="exec-summary-btn", color="warning",
-                                              style={'background-color': COLORS['gold_primary'], 'border-color': COLORS['gold_primary']}),
-                                    dbc.Button("Financial Report PDF", id="financial-report-btn", color="secondary"),
-                                    dbc.Button("Performance Analytics", id="performance-report-btn", color="info")
-                                ], className="mb-3"),
-                                html.Hr(),
-                                html.H6("Report History"),
-                                html.Ul([
-                                    html.Li(f"Executive Summary - {datetime.now().strftime('%Y-%m-%d %H:%M')}"),
-                                    html.Li(f"Financial Report - {(datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')}"),
-                                    html.Li(f"Performance Report - {(datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d %H:%M')}")
-                                ], style={'color': COLORS['neutral_text']})
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=8),
-                    dbc.Col([
-                        # Quick Stats
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H5("Quick Statistics"),
-                                html.P(f"Reports Generated This Month: 12", style={'color': COLORS['neutral_text']}),
-                                html.P(f"Last Export: {datetime.now().strftime('%Y-%m-%d')}", style={'color': COLORS['neutral_text']}),
-                                html.P(f"Total Data Points: 1,247", style={'color': COLORS['neutral_text']}),
-                                html.Hr(),
-                                html.Div([
-                                    dcc.Graph(
-                                        figure=create_risk_gauge(),
-                                        config={'displayModeBar': False},
-                                        style={'height': '300px'}
-                                    )
-                                ])
+        get_header("Reports & Exports"),
+        dbc.Container([
+            dbc.Row([
+                dbc.Col([
+                    html.H3("Generate Reports", style={'color': COLORS['gold_primary']}),
+                    neutral_p("Create and download professional reports"),
+                    html.Hr(style={'border-color': COLORS['gold_primary']}),
+                    
+                    # Report Options
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H5("Available Reports"),
+                            dbc.ButtonGroup([
+                                dbc.Button("Executive Summary PDF", id={'type': 'pdf-download', 'report': 'Executive_Summary'}, color="warning",
+                                          style={'background-color': COLORS['gold_primary'], 'border-color': COLORS['gold_primary']}),
+                                dbc.Button("Financial Report PDF", id={'type': 'pdf-download', 'report': 'Financial_Report'}, color="secondary"),
+                                dbc.Button("Performance Analytics", id={'type': 'pdf-download', 'report': 'Performance_Report'}, color="info")
+                            ], className="mb-3"),
+                            html.Hr(),
+                            html.H6("Report History"),
+                            html.Ul([
+                                html.Li(f"Executive Summary - {now.strftime('%Y-%m-%d %H:%M')}"),
+                                html.Li(f"Financial Report - {(now - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')}"),
+                                html.Li(f"Performance Report - {(now - timedelta(days=3)).strftime('%Y-%m-%d %H:%M')}")
+                            ], style=NEUTRAL_STYLE)
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=8),
+                dbc.Col([
+                    # Quick Stats
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H5("Quick Statistics"),
+                            neutral_p("Reports Generated This Month: 12"),
+                            neutral_p(f"Last Export: {now.strftime('%Y-%m-%d')}"),
+                            neutral_p("Total Data Points: 1,247"),
+                            html.Hr(),
+                            html.Div([
+                                dcc.Graph(
+                                    figure=STATIC_FIGS['risk'],
+                                    config=GRAPH_CONFIG_STATIC,
+                                    style={'height': '300px'}
+                                )
                             ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=4)
-                ])
-            ], fluid=True)
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=4)
+            ])
+        ], fluid=True)
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
 
 # Settings page layout
+@cache.memoize(timeout=300)
 def get_settings_layout():
+    now = datetime.now()
     return html.Div([
-        get_sidebar(),
-        html.Div([
-            get_header("Dashboard Settings"),
-            dbc.Container([
-                dbc.Row([
-                    dbc.Col([
-                        # Display Settings
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H5("Display Settings"),
-                                dbc.Row([
-                                    dbc.Col([
-                                        dbc.Label("Refresh Interval"),
-                                        dcc.Dropdown(
-                                            id="refresh-interval-dropdown",
-                                            options=[
-                                                {"label": "1 minute", "value": 60000},
-                                                {"label": "5 minutes", "value": 300000},
-                                                {"label": "10 minutes", "value": 600000},
-                                                {"label": "30 minutes", "value": 1800000}
-                                            ],
-                                            value=300000,
-                                            style={'color': '#000'}
-                                        )
-                                    ], width=6),
-                                    dbc.Col([
-                                        dbc.Label("Theme"),
-                                        dcc.Dropdown(
-                                            id="theme-dropdown",
-                                            options=[
-                                                {"label": "Dark Gold (Current)", "value": "dark_gold"},
-                                                {"label": "Light Mode", "value": "light"},
-                                                {"label": "Blue Theme", "value": "blue"}
-                                            ],
-                                            value="dark_gold",
-                                            style={'color': '#000'}
-                                        )
-                                    ], width=6)
-                                ], className="mb-3"),
-                                dbc.Row([
-                                    dbc.Col([
-                                        dbc.Checklist(
-                                            options=[
-                                                {"label": "Show animations", "value": "animations"},
-                                                {"label": "Auto-refresh", "value": "auto_refresh"},
-                                                {"label": "Sound notifications", "value": "sound"}
-                                            ],
-                                            value=["animations", "auto_refresh"],
-                                            id="settings-checklist"
-                                        )
-                                    ])
+        get_header("Dashboard Settings"),
+        dbc.Container([
+            dbc.Row([
+                dbc.Col([
+                    # Display Settings
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H5("Display Settings"),
+                            dbc.Row([
+                                dbc.Col([
+                                    dbc.Label("Refresh Interval"),
+                                    dcc.Dropdown(
+                                        id="refresh-interval-dropdown",
+                                        options=[
+                                            {"label": "1 minute", "value": 60000},
+                                            {"label": "5 minutes", "value": 300000},
+                                            {"label": "10 minutes", "value": 600000},
+                                            {"label": "30 minutes", "value": 1800000}
+                                        ],
+                                        value=300000,
+                                        style={'color': '#000'}
+                                    )
+                                ], width=6),
+                                dbc.Col([
+                                    dbc.Label("Theme"),
+                                    dcc.Dropdown(
+                                        id="theme-dropdown",
+                                        options=[
+                                            {"label": "Dark Gold (Current)", "value": "dark_gold"},
+                                            {"label": "Light Mode", "value": "light"},
+                                            {"label": "Blue Theme", "value": "blue"}
+                                        ],
+                                        value="dark_gold",
+                                        style={'color': '#000'}
+                                    )
+                                ], width=6)
+                            ], className="mb-3"),
+                            dbc.Row([
+                                dbc.Col([
+                                    dbc.Checklist(
+                                        options=[
+                                            {"label": "Show animations", "value": "animations"},
+                                            {"label": "Auto-refresh", "value": "auto_refresh"},
+                                            {"label": "Sound notifications", "value": "sound"}
+                                        ],
+                                        value=["animations", "auto_refresh"],
+                                        id="settings-checklist"
+                                    )
                                 ])
                             ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=8),
-                    dbc.Col([
-                        # System Info
-                        dbc.Card([
-                            dbc.CardBody([
-                                html.H5("System Information"),
-                                html.P(f"Dashboard Version: 2.1.0", style={'color': COLORS['neutral_text']}),
-                                html.P(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", style={'color': COLORS['neutral_text']}),
-                                html.P(f"Data Sources: 8 Active", style={'color': COLORS['neutral_text']}),
-                                html.P(f"Uptime: 99.9%", style={'color': COLORS['success_green']}),
-                                html.Hr(),
-                                dbc.Button("Clear Cache", color="danger", size="sm", className="me-2"),
-                                dbc.Button("Reset Settings", color="warning", size="sm")
-                            ])
-                        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}'})
-                    ], width=4)
-                ])
-            ], fluid=True)
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=8),
+                dbc.Col([
+                    # System Info
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H5("System Information"),
+                            neutral_p("Dashboard Version: 2.1.0"),
+                            neutral_p(f"Last Updated: {now.strftime('%Y-%m-%d %H:%M')}"),
+                            neutral_p("Data Sources: 8 Active"),
+                            html.P(f"Uptime: 99.9%", style={'color': COLORS['success_green']}),
+                            html.Hr(),
+                            dbc.Button("Clear Cache", color="danger", size="sm", className="me-2"),
+                            dbc.Button("Reset Settings", color="warning", size="sm")
+                        ])
+                    ], style=CARD_BOX_STYLE)
+                ], width=4)
+            ])
+        ], fluid=True)
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
 
 # Archive page layout
+@cache.memoize(timeout=300)
 def get_archive_layout():
-    archive_cards = []
-    for item in data['archive']:
-        card = dbc.Card([
-            dbc.CardImg(src="/assets/lexcura_logo.png", top=True, style={'height': '200px', 'object-fit': 'cover'}),
+    # Shared by every card instead of being rebuilt per archive item
+    card_style = {**CARD_BOX_STYLE, 'margin-bottom': '20px'}
+    image_style = {'height': '200px', 'object-fit': 'cover'}
+    button_style = {'background-color': COLORS['gold_primary'], 'border-color': COLORS['gold_primary']}
+    
+    archive_cards = [
+        dbc.Col(dbc.Card([
+            dbc.CardImg(src="/assets/lexcura_logo.png", top=True, style=image_style),
             dbc.CardBody([
                 html.H5(item['title'], className="card-title"),
                 html.P(f"Created: {item['date']}", className="card-text text-muted"),
                 dbc.Button("Open Presentation", href=item['url'], target="_blank", 
-                          color="warning", style={'background-color': COLORS['gold_primary'],
-                                                'border-color': COLORS['gold_primary']})
+                          color="warning", style=button_style)
             ])
-        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}',
-                 'margin-bottom': '20px'})
-        archive_cards.append(dbc.Col(card, width=12, md=6, lg=4))
+        ], style=card_style), width=12, md=6, lg=4)
+        for item in data['archive']
+    ]
     
     return html.Div([
-        get_sidebar(),
-        html.Div([
-            get_header("Archive - Historical Reports"),
-            dbc.Container([
-                dbc.Row([
-                    dbc.Col([
-                        html.H3("Google Slides Archive", style={'color': COLORS['gold_primary']}),
-                        html.P("Access all historical presentation reports", style={'color': COLORS['neutral_text']}),
-                        html.Hr(style={'border-color': COLORS['gold_primary']}),
-                        dbc.Row(archive_cards)
-                    ])
+        get_header("Archive - Historical Reports"),
+        dbc.Container([
+            dbc.Row([
+                dbc.Col([
+                    html.H3("Google Slides Archive", style={'color': COLORS['gold_primary']}),
+                    neutral_p("Access all historical presentation reports"),
+                    html.Hr(style={'border-color': COLORS['gold_primary']}),
+                    dbc.Row(archive_cards)
                 ])
-            ], fluid=True)
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+            ])
+        ], fluid=True)
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
+
+# html.Iframe has no `loading` prop, so the embed is written as raw HTML to get native lazy-loading
+SLIDES_IFRAME_HTML = (
+    '<iframe src="https://docs.google.com/presentation/d/e/YOUR_PRESENTATION_ID/embed?start=false&loop=false&delayms=3000"'
+    ' title="Google Slides presentation" loading="lazy" referrerpolicy="no-referrer"'
+    f' style="width: 100%; height: 600px; border: 2px solid {COLORS["gold_primary"]}; border-radius: 10px;"></iframe>'
+)
 
 # Google Slides integration layout
 def get_google_slides_layout():
     return html.Div([
-        get_sidebar(),
-        html.Div([
-            get_header("Live Google Slides"),
-            dbc.Container([
-                dbc.Row([
-                    dbc.Col([
-                        html.H3("Current Presentation", style={'color': COLORS['gold_primary']}),
-                        html.P("View and interact with the latest presentation", style={'color': COLORS['neutral_text']}),
-                        html.Hr(style={'border-color': COLORS['gold_primary']}),
-                        html.Div([
-                            html.Iframe(
-                                src="https://docs.google.com/presentation/d/e/YOUR_PRESENTATION_ID/embed?start=false&loop=false&delayms=3000",
-                                style={
-                                    'width': '100%',
-                                    'height': '600px',
-                                    'border': f'2px solid {COLORS["gold_primary"]}',
-                                    'border-radius': '10px'
-                                }
-                            )
-                        ]),
-                        html.Br(),
-                        dbc.Row([
-                            dbc.Col([
-                                dbc.Button("Open in New Tab", id="open-slides-btn", color="warning",
-                                          style={'background-color': COLORS['gold_primary'],
-                                                'border-color': COLORS['gold_primary']})
-                            ], width=6),
-                            dbc.Col([
-                                dbc.Button("Download PDF", id="download-slides-btn", color="secondary")
-                            ], width=6)
-                        ])
+        get_header("Live Google Slides"),
+        dbc.Container([
+            dbc.Row([
+                dbc.Col([
+                    html.H3("Current Presentation", style={'color': COLORS['gold_primary']}),
+                    neutral_p("View and interact with the latest presentation"),
+                    html.Hr(style={'border-color': COLORS['gold_primary']}),
+                    html.Div([
+                        dcc.Markdown(SLIDES_IFRAME_HTML, dangerously_allow_html=True)
+                    ]),
+                    html.Br(),
+                    dbc.Row([
+                        dbc.Col([
+                            dbc.Button("Open in New Tab", id="open-slides-btn", color="warning",
+                                      style={'background-color': COLORS['gold_primary'],
+                                            'border-color': COLORS['gold_primary']})
+                        ], width=6),
+                        dbc.Col([
+                            dbc.Button("Download PDF", id="download-slides-btn", color="secondary")
+                        ], width=6)
                     ])
                 ])
-            ], fluid=True)
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+            ])
+        ], fluid=True)
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
 
+# Built once for the persistent app shell (see app.layout)
 def get_sidebar():
     """Enhanced sidebar with Google Slides integration"""
+    now = datetime.now()
     return html.Div([
         html.Div([
             html.Div("LexCura", style={'font-size': '28px', 'font-weight': '700', 'color': COLORS['gold_primary']}),
@@ -996,15 +1166,14 @@ def get_sidebar():
                     html.Small("Online", style={'color': COLORS['success_green']})
                 ], className="mb-1"),
                 html.Div([
-                    html.Small(f"Uptime: 99.9%", style={'color': COLORS['neutral_text']})
+                    html.Small(f"Uptime: 99.9%", style=NEUTRAL_STYLE)
                 ]),
                 html.Div([
-                    html.Small(f"Last Update: {datetime.now().strftime('%H:%M')}", 
-                              style={'color': COLORS['neutral_text']})
+                    html.Small(f"Last Update: {now.strftime('%H:%M')}", id='sidebar-clock',
+                              style=NEUTRAL_STYLE)
                 ])
             ])
-        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}',
-                  'margin': '20px 10px', 'border-radius': '10px'}),
+        ], style=SIDEBAR_CARD_STYLE),
         
         # Reports Section
         dbc.Card([
@@ -1028,15 +1197,14 @@ def get_sidebar():
                        style={'width': '100%'})
                 ])
             ])
-        ], style={'background-color': COLORS['dark_grey'], 'border': f'1px solid {COLORS["gold_primary"]}',
-                  'margin': '20px 10px', 'border-radius': '10px'}),
+        ], style=SIDEBAR_CARD_STYLE),
         
         # Action Buttons
         html.Div([
             dbc.Button([
                 html.I(className="fas fa-download", style={'margin-right': '8px'}),
                 "Export Data"
-            ], id="pdf-reports-btn", color="warning", size="sm", className="sidebar-btn",
+            ], id={'type': 'pdf-download', 'report': 'Dashboard_Report'}, color="warning", size="sm", className="sidebar-btn",
                style={'width': '90%', 'margin': '10px 5%', 'background-color': COLORS['gold_primary'],
                       'border-color': COLORS['gold_primary']}),
             
@@ -1056,8 +1224,35 @@ def get_sidebar():
         ])
     ], className="sidebar")
 
+# Header KPI cards - (icon, color, value, label, trend icon, trend text)
+HEADER_KPIS = [
+    ('fa-dollar-sign', COLORS['gold_primary'], '$2.85M', 'Total Revenue', 'fa-arrow-up', '+12.5%'),
+    ('fa-exclamation-triangle', COLORS['warning_orange'], '74', 'Active Alerts', 'fa-arrow-down', '-8'),
+    ('fa-shield-alt', COLORS['success_green'], '99.9%', 'System Uptime', 'fa-check', 'Stable')
+]
+
+def _kpi_card_html(icon, color, value, label, trend_icon, trend_text):
+    return (
+        '<div class="col-4"><div class="card elite-mini-card floating"><div class="card-body elite-kpi-card">'
+        f'<div class="kpi-icon-value"><i class="fas {icon}" style="color: {color}; font-size: 20px;"></i>'
+        f'<h4 style="color: {color}; margin: 0; font-weight: 700; font-size: 26px;">{value}</h4></div>'
+        f'<small style="color: {COLORS["neutral_text"]}; font-weight: 500; font-size: 13px;">{label}</small>'
+        f'<div><i class="fas {trend_icon}" style="color: {COLORS["success_green"]}; font-size: 12px;"></i>'
+        f'<span style="color: {COLORS["success_green"]}; font-size: 13px; font-weight: 600;"> {trend_text}</span></div>'
+        '</div></div></div>'
+    )
+
+# Built once; the header KPIs never change between renders
+HEADER_KPI_HTML = (
+    '<div class="elite-kpi-container"><div class="row g-3">'
+    + ''.join(_kpi_card_html(*kpi) for kpi in HEADER_KPIS)
+    + '</div></div>'
+)
+
+@lru_cache(maxsize=8)
 def get_header(title="Executive Business Intelligence Dashboard"):
     """Elite header with enhanced KPI cards and shining effect"""
+    now = datetime.now()
     return html.Div([
         dbc.Row([
             dbc.Col([
@@ -1069,7 +1264,8 @@ def get_header(title="Executive Business Intelligence Dashboard"):
                     html.Div([
                         html.Span([
                             html.I(className="fas fa-clock", style={'margin-right': '8px'}),
-                            f"Last Updated: {datetime.now().strftime('%A, %B %d, %Y at %I:%M %p')}"
+                            html.Span(f"Last Updated: {now.strftime('%A, %B %d, %Y at %I:%M %p')}",
+                                      id='header-clock')
                         ], style={'margin-right': '25px', 'color': COLORS['neutral_text']}),
                         html.Span([
                             html.Span("●", className="status-dot heartbeat", 
@@ -1080,68 +1276,8 @@ def get_header(title="Executive Business Intelligence Dashboard"):
                 ])
             ], width=12, lg=6),
             dbc.Col([
-                # Enhanced KPI Cards with more width
-                html.Div([
-                    dbc.Row([
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-dollar-sign", 
-                                               style={'color': COLORS['gold_primary'], 'font-size': '20px'}),
-                                        html.H4("$2.85M", 
-                                               style={'color': COLORS['gold_primary'], 'margin': '0', 'font-weight': '700', 'font-size': '26px'})
-                                    ], className="kpi-icon-value"),
-                                    html.Small("Total Revenue", 
-                                              style={'color': COLORS['neutral_text'], 'font-weight': '500', 'font-size': '13px'}),
-                                    html.Div([
-                                        html.I(className="fas fa-arrow-up", 
-                                               style={'color': COLORS['success_green'], 'font-size': '12px'}),
-                                        html.Span(" +12.5%", style={'color': COLORS['success_green'], 'font-size': '13px', 'font-weight': '600'})
-                                    ])
-                                ], className="elite-kpi-card")
-                            ], className="elite-mini-card floating")
-                        ], width=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-exclamation-triangle", 
-                                               style={'color': COLORS['warning_orange'], 'font-size': '20px'}),
-                                        html.H4("74", 
-                                               style={'color': COLORS['warning_orange'], 'margin': '0', 'font-weight': '700', 'font-size': '26px'})
-                                    ], className="kpi-icon-value"),
-                                    html.Small("Active Alerts", 
-                                              style={'color': COLORS['neutral_text'], 'font-weight': '500', 'font-size': '13px'}),
-                                    html.Div([
-                                        html.I(className="fas fa-arrow-down", 
-                                               style={'color': COLORS['success_green'], 'font-size': '12px'}),
-                                        html.Span(" -8", style={'color': COLORS['success_green'], 'font-size': '13px', 'font-weight': '600'})
-                                    ])
-                                ], className="elite-kpi-card")
-                            ], className="elite-mini-card floating")
-                        ], width=4),
-                        dbc.Col([
-                            dbc.Card([
-                                dbc.CardBody([
-                                    html.Div([
-                                        html.I(className="fas fa-shield-alt", 
-                                               style={'color': COLORS['success_green'], 'font-size': '20px'}),
-                                        html.H4("99.9%", 
-                                               style={'color': COLORS['success_green'], 'margin': '0', 'font-weight': '700', 'font-size': '26px'})
-                                    ], className="kpi-icon-value"),
-                                    html.Small("System Uptime", 
-                                              style={'color': COLORS['neutral_text'], 'font-weight': '500', 'font-size': '13px'}),
-                                    html.Div([
-                                        html.I(className="fas fa-check", 
-                                               style={'color': COLORS['success_green'], 'font-size': '12px'}),
-                                        html.Span(" Stable", style={'color': COLORS['success_green'], 'font-size': '13px', 'font-weight': '600'})
-                                    ])
-                                ], className="elite-kpi-card")
-                            ], className="elite-mini-card floating")
-                        ], width=4)
-                    ], className="g-3")  # Increased gap between cards
-                ], className="elite-kpi-container")
+                # Static KPI cards, rendered from a single pre-built HTML block
+                dcc.Markdown(HEADER_KPI_HTML, dangerously_allow_html=True)
             ], width=12, lg=6)
         ], align="center")
     ], className="header elite-header")
@@ -1149,134 +1285,30 @@ def get_header(title="Executive Business Intelligence Dashboard"):
 # Main dashboard layout
 def get_dashboard_layout():
     return html.Div([
-        get_sidebar(),
+        get_header("Executive Business Intelligence Dashboard"),
         html.Div([
-            get_header("Executive Business Intelligence Dashboard"),
-            html.Div([
-                # Charts Grid Container
-                html.Div([
-                    # Financial Impact Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='financial-impact-chart',
-                                figure=create_financial_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Deadline Tracker Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='deadline-tracker-chart',
-                                figure=create_deadline_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Alert Severity Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='alert-severity-chart',
-                                figure=create_alert_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Historical Trends Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='historical-trends-chart',
-                                figure=create_historical_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Growth vs Decline Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='growth-decline-chart',
-                                figure=create_growth_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Performance Comparison Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='performance-comparison-chart',
-                                figure=create_performance_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Risk & Compliance Gauge
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='risk-compliance-gauge',
-                                figure=create_risk_gauge(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                    # Projection & Forecast Chart
-                    html.Div([
-                        dcc.Loading([
-                            dcc.Graph(
-                                id='projection-forecast-chart',
-                                figure=create_projection_chart(),
-                                config={'displayModeBar': False, 'responsive': True},
-                                style={'height': '420px'}
-                            )
-                        ], color=COLORS['gold_primary'])
-                    ], className="card"),
-                    
-                ], className="chart-grid"),
-                
-                # Status indicator - NO EMOJIS
-                html.Div([
-                    html.Div(id='status-indicator', children=[
-                        html.Span("● ", style={'color': COLORS['success_green'], 'font-size': '20px'}),
-                        html.Span("System Online", style={'color': COLORS['neutral_text']})
-                    ], style={'text-align': 'center', 'padding': '20px', 'font-size': '14px'})
-                ])
-                
-            ], id="dashboard-content"),
+            # Charts Grid Container
+            html.Div(get_dashboard_grid(), className="chart-grid"),
             
-            # Auto-refresh interval component
-            dcc.Interval(
-                id='auto-refresh-interval',
-                interval=300000,  # 5 minutes
-                n_intervals=0
-            ),
+            # Status indicator - NO EMOJIS
+            html.Div([
+                html.Div(id='status-indicator', children=[
+                    html.Span("● ", className="status-dot", style={'color': COLORS['success_green'], 'font-size': '20px'}),
+                    # Timestamp is written in the browser on every refresh tick (assets/clientside.js)
+                    html.Span("System Online", id='status-text', style=NEUTRAL_STYLE)
+                ], style={'text-align': 'center', 'padding': '20px', 'font-size': '14px'})
+            ]),
             
-            # Download component for PDF
-            dcc.Download(id="download-pdf")
+            # Pre-serialized figures for the lazy charts (assets/clientside.js)
+            dcc.Store(id='lazy-figures', data={graph_id: STATIC_FIGS[name] for graph_id, name in LAZY_GRAPHS.items()}),
+            # Data version of each figure this browser was sent, read by the refresh callbacks
+            dcc.Store(id='figure-versions', data=dict(STATIC_FIG_VERSIONS))
             
-        ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
-    ])
+        ], id="dashboard-content", **{'data-lazy': 'pending'})
+        
+    ], className="main-content", style={'margin-left': '280px', 'padding': '20px'})
 
-# Enhanced CSS with Font Awesome icons
+# Page shell - theme CSS is served from assets/theme.css
 app.index_string = '''
 <!DOCTYPE html>
 <html>
@@ -1284,756 +1316,10 @@ app.index_string = '''
         {%metas%}
         <title>LexCura Executive Dashboard</title>
         {%favicon%}
+        <link rel="preconnect" href="https://fonts.googleapis.com">
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
         {%css%}
-        <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-                background-color: #0F1113;
-                color: #B8B9BB;
-                overflow-x: hidden;
-            }
-            
-            .sidebar {
-                background: linear-gradient(180deg, #1B1D1F 0%, #0F1113 100%);
-                border-right: 2px solid #D4AF37;
-                height: 100vh;
-                position: fixed;
-                width: 280px;
-                padding: 30px 20px;
-                z-index: 1000;
-                box-shadow: 4px 0 15px rgba(0, 0, 0, 0.3);
-            }
-            
-            .logo {
-                font-size: 26px;
-                font-weight: 700;
-                color: #D4AF37;
-                margin-bottom: 40px;
-                padding-bottom: 20px;
-                border-bottom: 1px solid #2A2D30;
-                text-align: center;
-            }
-            
-            /* Elite Premium Dashboard Styling */
-            .elite-header {
-                background: linear-gradient(135deg, #1B1D1F 0%, #2A2D30 50%, #1B1D1F 100%);
-                border: 2px solid #D4AF37;
-                border-radius: 20px;
-                padding: 25px;
-                margin-bottom: 30px;
-                box-shadow: 
-                    0 0 50px rgba(212, 175, 55, 0.2),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .elite-header::before {
-                content: '';
-                position: absolute;
-                top: -2px;
-                left: -2px;
-                right: -2px;
-                bottom: -2px;
-                background: linear-gradient(45deg, #D4AF37, #FFCF66, #D4AF37, #FFCF66);
-                z-index: -1;
-                border-radius: 20px;
-                background-size: 400% 400%;
-                animation: gradientBorder 4s ease infinite;
-            }
-            
-            @keyframes gradientBorder {
-                0%, 100% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-            }
-            
-            .elite-title {
-                font-size: 36px !important;
-                font-weight: 800 !important;
-                margin-bottom: 15px !important;
-                background: linear-gradient(135deg, #D4AF37, #FFCF66, #D4AF37);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-                text-shadow: none !important;
-            }
-            
-            .elite-mini-card {
-                background: linear-gradient(145deg, 
-                    rgba(27, 29, 31, 0.9) 0%, 
-                    rgba(42, 45, 48, 0.9) 100%) !important;
-                border: 1px solid rgba(212, 175, 55, 0.3) !important;
-                border-radius: 15px !important;
-                backdrop-filter: blur(20px);
-                box-shadow: 
-                    0 8px 25px rgba(0, 0, 0, 0.4),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275) !important;
-            }
-            
-            .elite-mini-card:hover {
-                transform: translateY(-10px) scale(1.05) !important;
-                border-color: rgba(212, 175, 55, 0.6) !important;
-                box-shadow: 
-                    0 20px 50px rgba(0, 0, 0, 0.6),
-                    0 0 30px rgba(212, 175, 55, 0.3),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.2);
-            }
-            
-            .kpi-icon-value {
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                gap: 8px;
-                margin-bottom: 8px;
-            }
-            
-            .elite-kpi-card {
-                padding: 20px 15px !important;
-            }
-            
-            .heartbeat {
-                animation: heartbeat 2s infinite;
-            }
-            
-            @keyframes heartbeat {
-                0%, 100% { 
-                    transform: scale(1); 
-                    opacity: 1; 
-                }
-                25% { 
-                    transform: scale(1.2); 
-                    opacity: 0.8; 
-                }
-                50% { 
-                    transform: scale(1); 
-                    opacity: 1; 
-                }
-            }
-            
-            /* CRITICAL LAYOUT FIXES */
-            .sidebar {
-                background: linear-gradient(180deg, 
-                    rgba(27, 29, 31, 0.95) 0%, 
-                    rgba(15, 17, 19, 0.98) 100%);
-                backdrop-filter: blur(20px);
-                border-right: 3px solid #D4AF37;
-                box-shadow: 
-                    4px 0 30px rgba(0, 0, 0, 0.5),
-                    inset -1px 0 0 rgba(212, 175, 55, 0.2);
-                height: 100vh;
-                position: fixed;
-                width: 280px;
-                padding: 20px 15px;
-                z-index: 1000;
-                overflow-y: auto;
-            }
-            
-            .main-content {
-                margin-left: 280px !important;
-                padding: 20px !important;
-                min-height: 100vh;
-                width: calc(100vw - 280px) !important;
-            }
-            
-            .chart-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-                gap: 20px;
-                margin-top: 20px;
-                width: 100%;
-            }
-            
-            /* Fix header layout - wider KPI cards */
-            .elite-header {
-                background: linear-gradient(135deg, #1B1D1F 0%, #2A2D30 50%, #1B1D1F 100%);
-                border: 2px solid #D4AF37;
-                border-radius: 20px;
-                padding: 25px 30px;
-                margin-bottom: 25px;
-                box-shadow: 
-                    0 0 50px rgba(212, 175, 55, 0.2),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                position: relative;
-                overflow: hidden;
-                width: 100%;
-            }
-            
-            .elite-header::before {
-                content: '';
-                position: absolute;
-                top: -2px;
-                left: -2px;
-                right: -2px;
-                bottom: -2px;
-                background: linear-gradient(45deg, #D4AF37, #FFCF66, #D4AF37, #FFCF66);
-                z-index: -1;
-                border-radius: 20px;
-                background-size: 400% 400%;
-                animation: gradientBorder 4s ease infinite;
-            }
-            
-            /* SHINING EFFECT ON MAIN HEADER */
-            .elite-header::after {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, 
-                    transparent 0%, 
-                    rgba(255, 255, 255, 0.4) 30%, 
-                    rgba(212, 175, 55, 0.6) 50%,
-                    rgba(255, 255, 255, 0.4) 70%, 
-                    transparent 100%);
-                animation: headerShine 6s ease-in-out infinite;
-                pointer-events: none;
-                z-index: 1;
-            }
-            
-            @keyframes headerShine {
-                0% { left: -100%; }
-                50% { left: 100%; }
-                100% { left: 100%; }
-            }
-            
-            /* WIDER KPI CARDS - Fixed text overflow */
-            .elite-kpi-container {
-                width: 100%;
-                min-width: 500px;
-            }
-            
-            .elite-mini-card {
-                background: linear-gradient(145deg, 
-                    rgba(27, 29, 31, 0.9) 0%, 
-                    rgba(42, 45, 48, 0.9) 100%) !important;
-                border: 1px solid rgba(212, 175, 55, 0.3) !important;
-                border-radius: 12px !important;
-                backdrop-filter: blur(20px);
-                box-shadow: 
-                    0 6px 20px rgba(0, 0, 0, 0.4),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                transition: all 0.3s ease !important;
-                height: 100%;
-                min-height: 120px;
-                min-width: 140px;
-            }
-            
-            .elite-kpi-card {
-                padding: 20px 15px !important;
-                text-align: center;
-                min-height: 100px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                align-items: center;
-            }
-            
-            .kpi-icon-value {
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                gap: 10px;
-                margin-bottom: 8px;
-                flex-wrap: nowrap;
-                white-space: nowrap;
-            }
-            
-            .kpi-icon-value h4 {
-                margin: 0 !important;
-                font-size: 24px !important;
-                font-weight: 700 !important;
-                white-space: nowrap;
-                overflow: visible;
-            }
-            
-            /* Ensure text doesn't break */
-            .elite-kpi-card small {
-                font-size: 12px !important;
-                white-space: nowrap !important;
-                margin-bottom: 5px;
-                display: block;
-                width: 100%;
-            }
-            
-            .elite-kpi-card div:last-child {
-                white-space: nowrap !important;
-                font-size: 11px !important;
-                margin-top: 5px;
-            }
-            
-            /* Button fixes */
-            .sidebar-btn {
-                transition: all 0.3s ease !important;
-                border-radius: 8px !important;
-                font-weight: 500 !important;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.3) !important;
-                border: none !important;
-                width: 100% !important;
-                margin-bottom: 8px !important;
-            }
-            
-            .sidebar-btn:hover {
-                transform: translateY(-2px) scale(1.02) !important;
-                box-shadow: 0 6px 20px rgba(0,0,0,0.4) !important;
-            }
-            
-            /* Card fixes */
-            .chart-grid .card {
-                background: linear-gradient(145deg, 
-                    rgba(27, 29, 31, 0.95) 0%, 
-                    rgba(37, 40, 48, 0.95) 100%);
-                backdrop-filter: blur(15px);
-                border: 2px solid rgba(212, 175, 55, 0.2);
-                border-radius: 15px;
-                box-shadow: 
-                    0 10px 30px rgba(0, 0, 0, 0.4),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                position: relative;
-                margin: 0;
-                padding: 20px;
-                height: auto;
-                min-height: 450px;
-            }
-            
-            .logo-enhanced {
-                background: linear-gradient(135deg, 
-                    rgba(212, 175, 55, 0.15) 0%, 
-                    rgba(255, 207, 102, 0.1) 50%,
-                    rgba(212, 175, 55, 0.05) 100%);
-                border: 1px solid rgba(212, 175, 55, 0.3);
-                border-radius: 15px;
-                margin: 20px 10px 25px 10px;
-                padding: 25px 20px;
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .logo-enhanced::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, 
-                    transparent, 
-                    rgba(212, 175, 55, 0.3), 
-                    transparent);
-                animation: logoShimmer 3s infinite;
-            }
-            
-            @keyframes logoShimmer {
-                0% { left: -100%; }
-                100% { left: 100%; }
-            }
-            
-            /* Elite chart containers */
-            .chart-grid .card {
-                background: linear-gradient(145deg, 
-                    rgba(27, 29, 31, 0.95) 0%, 
-                    rgba(37, 40, 48, 0.95) 100%);
-                backdrop-filter: blur(15px);
-                border: 2px solid rgba(212, 175, 55, 0.2);
-                border-radius: 20px;
-                box-shadow: 
-                    0 15px 40px rgba(0, 0, 0, 0.4),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                position: relative;
-            }
-            
-            .chart-grid .card::before {
-                content: '';
-                position: absolute;
-                top: -2px;
-                left: -2px;
-                right: -2px;
-                height: 6px;
-                background: linear-gradient(90deg, 
-                    #D4AF37 0%, 
-                    #FFCF66 25%, 
-                    #D4AF37 50%, 
-                    #FFCF66 75%, 
-                    #D4AF37 100%);
-                background-size: 200% 100%;
-                animation: borderFlow 4s linear infinite;
-                border-radius: 20px 20px 0 0;
-                z-index: 1;
-            }
-            
-            @keyframes borderFlow {
-                0% { background-position: 0% 0%; }
-                100% { background-position: 200% 0%; }
-            }
-            
-            /* Elite status indicator */
-            #status-indicator {
-                background: linear-gradient(135deg, 
-                    rgba(212, 175, 55, 0.15) 0%, 
-                    rgba(0, 0, 0, 0.4) 100%);
-                border: 2px solid rgba(212, 175, 55, 0.4);
-                border-radius: 30px;
-                padding: 20px 30px;
-                backdrop-filter: blur(20px);
-                box-shadow: 
-                    0 10px 30px rgba(0, 0, 0, 0.5),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            #status-indicator::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, 
-                    transparent, 
-                    rgba(212, 175, 55, 0.2), 
-                    transparent);
-                animation: statusShine 5s infinite;
-            }
-            
-            /* Notification badge styling */
-            .notification-badge {
-                position: absolute;
-                top: -8px;
-                right: -8px;
-                background: linear-gradient(45deg, #E4574C, #F4A261);
-                color: white;
-                border-radius: 50%;
-                width: 20px;
-                height: 20px;
-                font-size: 12px;
-                font-weight: bold;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                border: 2px solid #0F1113;
-                animation: badgePulse 2s infinite;
-            }
-            
-            @keyframes badgePulse {
-                0%, 100% { transform: scale(1); }
-                50% { transform: scale(1.1); }
-            }
-            
-            /* Enhanced button positioning for badges */
-            .button-with-badge {
-                position: relative;
-                display: inline-block;
-            }
-            
-            /* Subtle data flow animation */
-            .data-flow {
-                position: absolute;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 2px;
-                background: linear-gradient(90deg, 
-                    transparent 0%, 
-                    #D4AF37 50%, 
-                    transparent 100%);
-                animation: dataStream 3s linear infinite;
-            }
-            
-            @keyframes dataStream {
-                0% { transform: translateX(-100%); }
-                100% { transform: translateX(100%); }
-            }
-            .logo-enhanced {
-                text-align: center;
-                padding: 20px;
-                border-bottom: 2px solid #D4AF37;
-                margin-bottom: 20px;
-                background: linear-gradient(135deg, rgba(212, 175, 55, 0.1) 0%, rgba(0,0,0,0) 100%);
-            }
-            
-            /* Sidebar button enhancements */
-            .sidebar-btn {
-                transition: all 0.3s ease;
-                border-radius: 8px !important;
-                font-weight: 500;
-                margin: 8px 5% !important;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.3);
-            }
-            
-            .sidebar-btn:hover {
-                transform: translateY(-2px) scale(1.02);
-                box-shadow: 0 6px 20px rgba(0,0,0,0.4);
-            }
-            
-            /* Chart loading animation */
-            .chart-loading {
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .chart-loading::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: -100%;
-                width: 100%;
-                height: 100%;
-                background: linear-gradient(90deg, transparent, rgba(212, 175, 55, 0.3), transparent);
-                animation: shimmer 2s infinite;
-                z-index: 1;
-            }
-            
-            @keyframes shimmer {
-                0% { left: -100%; }
-                100% { left: 100%; }
-            }
-            
-            /* Enhanced card animations */
-            .card {
-                transition: all 0.4s cubic-bezier(0.175, 0.885, 0.32, 1.275);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .card::after {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 3px;
-                background: linear-gradient(90deg, #D4AF37, #FFCF66, #D4AF37);
-                background-size: 200% 100%;
-                animation: gradientShift 3s ease-in-out infinite;
-            }
-            
-            @keyframes gradientShift {
-                0%, 100% { background-position: 0% 50%; }
-                50% { background-position: 100% 50%; }
-            }
-            
-            .card:hover {
-                transform: translateY(-8px) scale(1.02);
-                box-shadow: 0 20px 50px rgba(0, 0, 0, 0.6);
-                border-color: rgba(212, 175, 55, 0.6);
-            }
-            
-            /* Floating elements */
-            .floating {
-                animation: float 6s ease-in-out infinite;
-            }
-            
-            @keyframes float {
-                0%, 100% { transform: translateY(0px); }
-                50% { transform: translateY(-10px); }
-            }
-            
-            /* Glowing text effect */
-            .glow-text {
-                text-shadow: 0 0 10px rgba(212, 175, 55, 0.5);
-                animation: textGlow 2s ease-in-out infinite alternate;
-            }
-            
-            @keyframes textGlow {
-                from { text-shadow: 0 0 10px rgba(212, 175, 55, 0.5); }
-                to { text-shadow: 0 0 20px rgba(212, 175, 55, 0.8); }
-            }
-            
-            /* Enhanced status indicator */
-            #status-indicator {
-                background: linear-gradient(135deg, rgba(212, 175, 55, 0.1), rgba(0,0,0,0.3));
-                border-radius: 25px;
-                padding: 15px 25px;
-                border: 1px solid rgba(212, 175, 55, 0.3);
-                backdrop-filter: blur(10px);
-            }
-            
-            /* Scrollbar enhancements */
-            ::-webkit-scrollbar {
-                width: 12px;
-            }
-            
-            ::-webkit-scrollbar-track {
-                background: linear-gradient(180deg, #0F1113, #1B1D1F);
-                border-radius: 6px;
-            }
-            
-            ::-webkit-scrollbar-thumb {
-                background: linear-gradient(180deg, #D4AF37, #FFCF66);
-                border-radius: 6px;
-                border: 2px solid #0F1113;
-            }
-            
-            ::-webkit-scrollbar-thumb:hover {
-                background: linear-gradient(180deg, #FFCF66, #D4AF37);
-            }
-            
-            .nav-item.active {
-                background-color: rgba(212, 175, 55, 0.2);
-                color: #FFCF66 !important;
-                border-left-color: #D4AF37;
-                text-decoration: none !important;
-            }
-            
-            .main-content {
-                min-height: 100vh;
-            }
-            
-            .header {
-                background: linear-gradient(135deg, #1B1D1F 0%, #2A2D30 100%);
-                padding: 30px;
-                border-radius: 15px;
-                margin-bottom: 30px;
-                border-left: 5px solid #D4AF37;
-                box-shadow: 0 8px 25px rgba(0, 0, 0, 0.4);
-            }
-            
-            .header h1 {
-                color: #D4AF37;
-                margin: 0;
-                font-size: 32px;
-                font-weight: 700;
-                letter-spacing: -0.5px;
-            }
-            
-            .header p {
-                color: #B8B9BB;
-                margin: 15px 0 0 0;
-                font-size: 14px;
-                opacity: 0.8;
-            }
-            
-            .card {
-                background: linear-gradient(145deg, #1B1D1F 0%, #252830 100%);
-                border-radius: 15px;
-                padding: 25px;
-                margin: 15px;
-                box-shadow: 0 10px 30px rgba(0, 0, 0, 0.4);
-                border: 1px solid #2A2D30;
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 3px;
-                background: linear-gradient(90deg, #D4AF37, #FFCF66);
-            }
-            
-            .card:hover {
-                transform: translateY(-5px);
-                box-shadow: 0 15px 40px rgba(0, 0, 0, 0.5);
-            }
-            
-            .chart-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(550px, 1fr));
-                gap: 20px;
-                margin-top: 20px;
-            }
-            
-            /* Loading spinner customization */
-            ._dash-loading {
-                color: #D4AF37 !important;
-            }
-            
-            /* Mobile responsive */
-            @media (max-width: 1200px) {
-                .chart-grid {
-                    grid-template-columns: repeat(auto-fit, minmax(450px, 1fr));
-                }
-            }
-            
-            @media (max-width: 900px) {
-                .sidebar {
-                    transform: translateX(-100%);
-                    transition: transform 0.3s ease;
-                }
-                
-                .main-content {
-                    margin-left: 0 !important;
-                    padding: 15px !important;
-                }
-                
-                .chart-grid {
-                    grid-template-columns: 1fr;
-                    gap: 15px;
-                }
-            }
-            
-            /* Login button animation */
-            #login-button {
-                transition: all 0.3s ease;
-                transform: scale(1);
-                box-shadow: 0 4px 15px rgba(212, 175, 55, 0.3);
-            }
-            
-            #login-button:hover {
-                transform: scale(1.05);
-                box-shadow: 0 6px 25px rgba(212, 175, 55, 0.5);
-                background-color: #FFCF66 !important;
-            }
-            
-            #login-button:active {
-                transform: scale(0.98);
-                transition: all 0.1s ease;
-            }
-            
-            /* Input field styling */
-            .form-control:focus {
-                border-color: #D4AF37 !important;
-                box-shadow: 0 0 0 0.2rem rgba(212, 175, 55, 0.25) !important;
-            }
-            
-            /* Card animation */
-            .login-card {
-                animation: slideInUp 0.6s ease-out;
-                transform: translateY(0);
-            }
-            
-            @keyframes slideInUp {
-                from {
-                    transform: translateY(30px);
-                    opacity: 0;
-                }
-                to {
-                    transform: translateY(0);
-                    opacity: 1;
-                }
-            }
-            
-            /* Success alert animation */
-            .alert {
-                animation: fadeInDown 0.5s ease-out;
-            }
-            
-            @keyframes fadeInDown {
-                from {
-                    transform: translateY(-20px);
-                    opacity: 0;
-                }
-                to {
-                    transform: translateY(0);
-                    opacity: 1;
-                }
-            }
-        </style>
     </head>
     <body>
         {%app_entry%}
@@ -2046,17 +1332,33 @@ app.index_string = '''
 </html>
 '''
 
+# Initial figures - built once the layouts they invalidate are defined
+build_static_figs()
+
 # Main app layout with URL routing and session preservation
 app.layout = html.Div([
     dcc.Location(id='url', refresh=False),
     dcc.Store(id='session-store', storage_type='session'),
     dcc.Store(id='current-user', storage_type='session'),  # Additional session store
-    html.Div(id='page-content')
+    # Sidebar is rendered once and stays mounted; only page-content is swapped
+    html.Div(get_sidebar(), id='sidebar-container', style={'display': 'none'}),
+    html.Div(id='page-content', **{'data-motion': 'pending'}),
+    
+    # Auto-refresh interval component
+    dcc.Interval(
+        id='auto-refresh-interval',
+        interval=300000,  # 5 minutes
+        n_intervals=0
+    ),
+    
+    # Download component for PDF
+    dcc.Download(id="download-pdf")
 ])
 
 # Simplified page routing - only dashboard/login
 @app.callback(
-    Output('page-content', 'children'),
+    [Output('page-content', 'children'),
+     Output('sidebar-container', 'style')],
     [Input('url', 'pathname')],
     [State('session-store', 'data'),
      State('current-user', 'data')],
@@ -2069,10 +1371,10 @@ def display_page(pathname, session_data, user_data):
     authenticated = is_authenticated(session_data, user_data)
     
     if not authenticated:
-        return get_login_layout()
+        return get_login_layout(), {'display': 'none'}
     
     # For now, always show dashboard regardless of path
-    return get_dashboard_layout()
+    return get_dashboard_layout(), {}
 
 # Login callback with improved session handling
 @app.callback(
@@ -2093,7 +1395,8 @@ def handle_login(n_clicks, username, password):
                 'login_time': datetime.now().isoformat(),
                 'authenticated': True
             }
-            session_store[session_id] = session_data
+            with _session_store_lock:
+                session_store[session_id] = session_data
             
             return (
                 {'session_id': session_id, 'authenticated': True},
@@ -2123,9 +1426,8 @@ def handle_logout(n_clicks, session_data, user_data):
     if n_clicks and n_clicks > 0:
         # Clean up session store
         if session_data and session_data.get('session_id'):
-            session_id = session_data.get('session_id')
-            if session_id in session_store:
-                del session_store[session_id]
+            with _session_store_lock:
+                session_store.pop(session_data.get('session_id'), None)
         
         # Clear all session data - this will trigger login page display
         return {'authenticated': False}, {}
@@ -2133,166 +1435,153 @@ def handle_logout(n_clicks, session_data, user_data):
     # Return unchanged if no click
     return session_data or {'authenticated': False}, user_data or {}
 
+# One PCG64 generator per thread, created on first use - gthread workers never share
+# RNG state, and forked workers don't replay the master's stream
+_rng_local = threading.local()
+
+def get_rng():
+    """This thread's NumPy random generator"""
+    rng = getattr(_rng_local, 'rng', None)
+    if rng is None:
+        rng = _rng_local.rng = np.random.default_rng()
+    return rng
+
+def vary_data(vary_risk=False, spread=0.02):
+    """Swap in a new data snapshot with small random variations and return it
+    
+    The current financial series always varies; the risk score only when vary_risk is set.
+    """
+    global data
+    rng = get_rng()
+    with _data_lock:
+        current = data['financial']['current']
+        # One vectorized pass; the int64 cast truncates like int()
+        varied = _frozen((current * (1 + rng.uniform(-spread, spread, current.shape))).astype(np.int64))
+        version = next(_data_versions)
+        state = {**data, 'financial': {**data['financial'], 'current': varied},
+                 'versions': {**data['versions'], 'financial': version}}
+        if vary_risk:
+            state['risk_score'] = max(0, min(100, data['risk_score'] + rng.uniform(-2, 2)))
+            state['versions']['risk'] = version
+        data = state
+    return state
+
+# Refresh button clicks from one browser session closer together than this are dropped
+REFRESH_DEBOUNCE = 0.5  # seconds
+# Session ids that clicked Refresh within the debounce window - entries expire on their own
+_recent_refresh_clicks = TTLCache(maxsize=10_000, ttl=REFRESH_DEBOUNCE)
+_refresh_clicks_lock = threading.Lock()
+
+def _refresh_debounced(session_data):
+    """True when this browser session already clicked Refresh within REFRESH_DEBOUNCE"""
+    session_id = (session_data or {}).get('session_id')
+    if not session_id:
+        return False
+    with _refresh_clicks_lock:
+        if session_id in _recent_refresh_clicks:
+            return True
+        _recent_refresh_clicks[session_id] = True
+        return False
+
 # Manual refresh callback
 @app.callback(
-    [Output('financial-impact-chart', 'figure', allow_duplicate=True),
-     Output('deadline-tracker-chart', 'figure', allow_duplicate=True),
-     Output('alert-severity-chart', 'figure', allow_duplicate=True),
-     Output('historical-trends-chart', 'figure', allow_duplicate=True),
-     Output('growth-decline-chart', 'figure', allow_duplicate=True),
-     Output('performance-comparison-chart', 'figure', allow_duplicate=True),
-     Output('risk-compliance-gauge', 'figure', allow_duplicate=True),
-     Output('projection-forecast-chart', 'figure', allow_duplicate=True)],
+    [*[Output(graph_id, 'figure', allow_duplicate=True) for graph_id, _ in EAGER_GRAPHS],
+     Output('lazy-figures', 'data', allow_duplicate=True),
+     Output('figure-versions', 'data', allow_duplicate=True)],
     Input("refresh-manual-btn", "n_clicks"),
+    [State('session-store', 'data'),
+     State('figure-versions', 'data')],
     prevent_initial_call=True
 )
-def manual_refresh_charts(n_clicks):
-    if n_clicks and n_clicks > 0:
+def manual_refresh_charts(n_clicks, session_data, sent_versions):
+    if n_clicks and n_clicks > 0 and not _refresh_debounced(session_data):
         # Add small data variations for realistic updates
-        global data
-        for i in range(len(data['financial']['current'])):
-            variation = random.uniform(-0.02, 0.02)
-            data['financial']['current'][i] = int(data['financial']['current'][i] * (1 + variation))
+        state = vary_data()
         
-        return (
-            create_financial_chart(),
-            create_deadline_chart(),
-            create_alert_chart(),
-            create_historical_chart(),
-            create_growth_chart(),
-            create_performance_chart(),
-            create_risk_gauge(),
-            create_projection_chart()
-        )
+        # Only the financial series is rebuilt; this browser is sent it along with any
+        # other figure newer than the one it holds
+        build_static_figs(['financial'], state)
+        return refreshed_figures(sent_versions)
     
-    return [dash.no_update] * 8
-@app.callback(
-    Output("download-pdf", "data", allow_duplicate=True),
-    Input("pdf-reports-btn", "n_clicks"),
-    prevent_initial_call=True
-)
-def handle_pdf_reports(n_clicks):
-    if n_clicks and n_clicks > 0:
-        try:
-            pdf_buffer = generate_pdf_report()
-            if pdf_buffer:
-                return dcc.send_bytes(pdf_buffer.getvalue(), 
-                                    filename=f"LexCura_Dashboard_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf")
-        except Exception as e:
-            print(f"Error generating PDF: {str(e)}")
-    return None
+    return [dash.no_update] * REFRESH_OUTPUT_COUNT
+
+# PDF downloads - every report button shares one callback; the button id names the report
 @app.callback(
-    Output("download-pdf", "data", allow_duplicate=True),
-    [Input("exec-summary-btn", "n_clicks"),
-     Input("financial-report-btn", "n_clicks"), 
-     Input("performance-report-btn", "n_clicks")],
+    Output("download-pdf", "data"),
+    Input({'type': 'pdf-download', 'report': ALL}, "n_clicks"),
     prevent_initial_call=True
 )
-def handle_report_downloads(exec_clicks, financial_clicks, performance_clicks):
+def handle_pdf_downloads(n_clicks):
     ctx = dash.callback_context
-    if not ctx.triggered:
-        return None
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+    # Buttons mounting on a page change also trigger this, with no clicks
+    if not ctx.triggered_id or not ctx.triggered[0]['value']:
+        return dash.no_update
     
     try:
-        pdf_buffer = generate_pdf_report()
-        if pdf_buffer:
-            if button_id == "exec-summary-btn":
-                filename = f"LexCura_Executive_Summary_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-            elif button_id == "financial-report-btn":
-                filename = f"LexCura_Financial_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-            else:
-                filename = f"LexCura_Performance_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-            
-            return dcc.send_bytes(pdf_buffer.getvalue(), filename=filename)
+        pdf = _cached_pdf()
+        if pdf:
+            return dcc.send_bytes(pdf,
+                                  filename=f"LexCura_{ctx.triggered_id['report']}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf")
     except Exception as e:
-        print(f"Error in report download: {str(e)}")
+        print(f"Error generating PDF: {str(e)}")
     
-    return None
+    return dash.no_update
 
 # Dashboard refresh callback
 @app.callback(
-    [Output('financial-impact-chart', 'figure'),
-     Output('deadline-tracker-chart', 'figure'),
-     Output('alert-severity-chart', 'figure'),
-     Output('historical-trends-chart', 'figure'),
-     Output('growth-decline-chart', 'figure'),
-     Output('performance-comparison-chart', 'figure'),
-     Output('risk-compliance-gauge', 'figure'),
-     Output('projection-forecast-chart', 'figure'),
-     Output('status-indicator', 'children')],
-    [Input('auto-refresh-interval', 'n_intervals'),
-     Input('refresh-data-btn', 'n_clicks')]
+    [*[Output(graph_id, 'figure') for graph_id, _ in EAGER_GRAPHS],
+     Output('lazy-figures', 'data'),
+     Output('figure-versions', 'data')],
+    Input('auto-refresh-interval', 'n_intervals'),
+    State('figure-versions', 'data'),
+    # The layout already carries the current figures, so there is nothing to do on mount
+    prevent_initial_call=True
 )
-def update_dashboard_charts(n_intervals, refresh_clicks):
-    try:
-        global data
-        
-        # Add small variations for realistic updates
-        if n_intervals > 0 or refresh_clicks:
-            for i in range(len(data['financial']['current'])):
-                variation = random.uniform(-0.02, 0.02)
-                data['financial']['current'][i] = int(data['financial']['current'][i] * (1 + variation))
-            
-            data['risk_score'] = max(0, min(100, data['risk_score'] + random.uniform(-2, 2)))
-        
-        current_time = datetime.now().strftime('%I:%M %p')
-        status_indicator = [
-            html.Span("● ", className="status-dot", 
-                     style={'color': COLORS['success_green'], 'font-size': '20px'}),
-            html.Span(f"Live Data - Updated at {current_time}", 
-                     style={'color': COLORS['neutral_text']})
-        ]
-        
-        return (
-            create_financial_chart(),
-            create_deadline_chart(),
-            create_alert_chart(),
-            create_historical_chart(),
-            create_growth_chart(),
-            create_performance_chart(),
-            create_risk_gauge(),
-            create_projection_chart(),
-            status_indicator
-        )
-        
-    except Exception as e:
-        print(f"Error in dashboard update: {str(e)}")
-        error_status = [
-            html.Span("● ", style={'color': COLORS['danger_red'], 'font-size': '20px'}),
-            html.Span("Update Error - Using Cached Data", 
-                     style={'color': COLORS['neutral_text']})
-        ]
-        
-        return (
-            create_financial_chart(),
-            create_deadline_chart(),
-            create_alert_chart(),
-            create_historical_chart(),
-            create_growth_chart(),
-            create_performance_chart(),
-            create_risk_gauge(),
-            create_projection_chart(),
-            error_status
-        )
+def update_dashboard_charts(n_intervals, sent_versions):
+    # Add small variations for realistic updates - this only runs on interval ticks
+    state = vary_data(vary_risk=True)
+    
+    # Rebuild the charts whose data moved, then send this browser only the figures
+    # newer than the ones it holds; every other chart keeps its figure as-is. Build
+    # failures are contained per chart by build_static_figs
+    build_static_figs(state['versions'], state)
+    return refreshed_figures(sent_versions)
 
-# PDF Export callback
-@app.callback(
-    Output("download-pdf", "data"),
-    Input("export-pdf-btn", "n_clicks"),
-    prevent_initial_call=True
+# Clock updates run in the browser (assets/clientside.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='ui', function_name='tick'),
+    [Output('header-clock', 'children'),
+     Output('sidebar-clock', 'children')],
+    Input('auto-refresh-interval', 'n_intervals')
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace='ui', function_name='status'),
+    Output('status-text', 'children'),
+    Input('auto-refresh-interval', 'n_intervals')
+)
+
+# Lazy charts are drawn from the pre-loaded store as they scroll into view, and
+# redrawn from it when a refresh updates the store after they have been shown
+app.clientside_callback(
+    ClientsideFunction(namespace='lazy', function_name='observe'),
+    Output('dashboard-content', 'data-lazy'),
+    Input('lazy-figures', 'data')
+)
+
+# Decorative animations pause while offscreen; re-observe whenever the page changes
+app.clientside_callback(
+    ClientsideFunction(namespace='motion', function_name='observe'),
+    Output('page-content', 'data-motion'),
+    Input('page-content', 'children')
+)
+
+# No refresh work (server callbacks or Sheets fetches) while the tab is hidden
+app.clientside_callback(
+    ClientsideFunction(namespace='visibility', function_name='shouldRefresh'),
+    Output('auto-refresh-interval', 'disabled'),
+    Input('auto-refresh-interval', 'id')
 )
-def export_pdf_report(n_clicks):
-    if n_clicks:
-        try:
-            pdf_buffer = generate_pdf_report()
-            if pdf_buffer:
-                return dcc.send_bytes(pdf_buffer.getvalue(), 
-                                    filename=f"LexCura_Dashboard_Report_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf")
-        except Exception as e:
-            print(f"Error exporting PDF: {str(e)}")
-    return None
 
 # Google Slides callback
 @app.callback(
@@ -2307,6 +1596,7 @@ def open_google_slides(n_clicks):
         return "/slides"
     return "/slides"
 
+# Local development only - production runs `gunicorn app:server` (see gunicorn.conf.py)
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8050))
     app.run_server(
@@ -0,0 +1,112 @@
+/* Clientside callbacks - run in the browser without a server round-trip */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ui: {
+        /* Refresh the header and sidebar clocks on every auto-refresh tick */
+        tick: function (n_intervals) {
+            var now = new Date();
+            var date = now.toLocaleDateString('en-US', {
+                weekday: 'long', year: 'numeric', month: 'long', day: '2-digit'
+            });
+            var time12 = now.toLocaleTimeString('en-US', {hour: '2-digit', minute: '2-digit'});
+            var time24 = now.toLocaleTimeString('en-GB', {hour: '2-digit', minute: '2-digit'});
+            return [
+                'Last Updated: ' + date + ' at ' + time12,
+                'Last Update: ' + time24
+            ];
+        },
+        /* Live status line under the dashboard charts */
+        status: function (n_intervals) {
+            var time12 = new Date().toLocaleTimeString('en-US', {hour: '2-digit', minute: '2-digit'});
+            return 'Live Data - Updated at ' + time12;
+        }
+    },
+    lazy: {
+        /* Fill in below-the-fold charts from the pre-loaded store once visible.
+           Refresh callbacks write new figures into the store rather than into the
+           graphs, so charts already shown are redrawn from it and the rest pick up
+           the latest figure when they scroll into view */
+        observe: function (figures) {
+            if (!figures) {
+                return window.dash_clientside.no_update;
+            }
+            var lazy = window.dash_clientside.lazy;
+            lazy.figures = figures;
+            var render = function (card) {
+                var graphId = card.getAttribute('data-lazy-graph');
+                var figure = lazy.figures[graphId];
+                if (card.lazyFigure !== figure) {
+                    card.lazyFigure = figure;
+                    window.dash_clientside.set_props(graphId, {figure: figure});
+                }
+            };
+            /* Wait for the new page content to be mounted before querying it */
+            window.requestAnimationFrame(function () {
+                var cards = document.querySelectorAll('[data-lazy-graph]');
+                if (!('IntersectionObserver' in window)) {
+                    cards.forEach(render);
+                    return;
+                }
+                if (!lazy.observer) {
+                    lazy.observer = new IntersectionObserver(function (entries) {
+                        entries.forEach(function (entry) {
+                            if (entry.isIntersecting) {
+                                lazy.observer.unobserve(entry.target);
+                                entry.target.lazyShown = true;
+                                render(entry.target);
+                            }
+                        });
+                    }, {rootMargin: '200px'});
+                }
+                cards.forEach(function (card) {
+                    if (card.lazyShown) {
+                        render(card);
+                    } else if (!card.lazyObserved) {
+                        card.lazyObserved = true;
+                        lazy.observer.observe(card);
+                    }
+                });
+            });
+            return 'bound';
+        }
+    },
+    motion: {
+        /* Run the decorative CSS loops only while their element is on screen */
+        observe: function (children) {
+            var selector = '.heartbeat, .floating, .glow-text, .notification-badge';
+            var motion = window.dash_clientside.motion;
+            window.requestAnimationFrame(function () {
+                var elements = document.querySelectorAll(selector);
+                if (!('IntersectionObserver' in window)) {
+                    elements.forEach(function (el) {
+                        el.classList.add('visible');
+                    });
+                    return;
+                }
+                if (!motion.observer) {
+                    motion.observer = new IntersectionObserver(function (entries) {
+                        entries.forEach(function (entry) {
+                            entry.target.classList.toggle('visible', entry.isIntersecting);
+                        });
+                    });
+                }
+                elements.forEach(function (el) {
+                    motion.observer.observe(el);
+                });
+            });
+            return 'observed';
+        }
+    },
+    visibility: {
+        /* Pause the auto-refresh interval while the tab is hidden */
+        shouldRefresh: function (intervalId) {
+            var visibility = window.dash_clientside.visibility;
+            if (!visibility.bound) {
+                document.addEventListener('visibilitychange', function () {
+                    window.dash_clientside.set_props(intervalId, {disabled: document.hidden});
+                });
+                visibility.bound = true;
+            }
+            return document.hidden;
+        }
+    }
+});
@@ -0,0 +1,11 @@
+# UI-REFACTOR-GOLD-2025: Shared fixtures for the elite template tests
+import pytest
+import plotly.io as pio
+from plotly_templates import register_gold_dark_template
+
+
+@pytest.fixture(scope="session")
+def gold_dark():
+    """Register the gold_dark template once per test session and return it"""
+    register_gold_dark_template()
+    return pio.templates["gold_dark"]
@@ -1,36 +1,292 @@
-import gspread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import MaxRetryError, ResponseError
+import copy
 import json
 import os
+import threading
+import time
+from types import MappingProxyType
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+try:
+    # Decodes straight from bytes and several times faster than the stdlib
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SHEETS_API = 'https://sheets.googleapis.com/v4/spreadsheets'
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.readonly'
+]
+
+
+# Parsed on first use, then once per process; every connector authorizes from the same info
+@lru_cache(maxsize=1)
+def _service_account_info():
+    """Parse the GOOGLE_SERVICE_ACCOUNT JSON, or None if it is unset or invalid"""
+    raw = os.getenv('GOOGLE_SERVICE_ACCOUNT')
+    if not raw:
+        return None
+    try:
+        return json_loads(raw)
+    except ValueError as e:
+        logger.error(f"Invalid GOOGLE_SERVICE_ACCOUNT JSON: {str(e)}")
+        return None
+
+
+# Dashboard data shared by every worker when REDIS_URL is set (the same switch app.py's
+# Flask-Caching uses); otherwise each process keeps only its own TTL cache
+REDIS_URL = os.environ.get('REDIS_URL', '')
+# One worker refreshes an expired entry under a lock held for SHARED_LOCK_TTL seconds;
+# a worker with nothing to serve polls for its result at most that long before fetching itself
+SHARED_LOCK_TTL = 5
+SHARED_POLL_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=1)
+def _shared_cache():
+    """Redis client for the cross-worker cache, or None when it is disabled or unavailable"""
+    if not REDIS_URL:
+        return None
+    try:
+        import redis
+        return redis.Redis.from_url(REDIS_URL)
+    except Exception as e:
+        logger.error(f"Shared dashboard cache unavailable: {str(e)}")
+        return None
+
+
+# Bounds on one batchGet, which may run inline on a request thread
+SHEETS_TIMEOUT = (3.05, 10)  # seconds - connect, read for each attempt
+SHEETS_RETRY_WAIT_MAX = 5  # seconds - longest backoff or Retry-After wait between attempts
+SHEETS_DEADLINE = 20  # seconds - no retry is started once it could run past this
+
+# Deadline of the batchGet running on this thread, read by SheetsRetry
+_retry_deadline = threading.local()
+
+
+class SheetsRetry(Retry):
+    """Retry that caps Retry-After waits and gives up at the calling batchGet's deadline"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, SHEETS_RETRY_WAIT_MAX)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response=response, error=error, _pool=_pool, _stacktrace=_stacktrace)
+        deadline = getattr(_retry_deadline, 'value', None)
+        if deadline is not None and time.monotonic() + SHEETS_RETRY_WAIT_MAX > deadline:
+            raise MaxRetryError(_pool, url, error or ResponseError("Sheets request deadline exceeded"))
+        return retry
+
+
+# Quota (429) and server errors are retried with exponential backoff (0.5s, 1s, 2s, ...);
+# when Sheets sends Retry-After, that wait is used instead. Both are capped at
+# SHEETS_RETRY_WAIT_MAX, so a long Retry-After cannot hold a request thread
+SHEETS_RETRY = SheetsRetry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_max=SHEETS_RETRY_WAIT_MAX,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True
+)
+
+
+def _build_session(credentials):
+    """Authorized session that keeps Sheets connections alive and retries quota/server errors"""
+    session = AuthorizedSession(credentials)
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=SHEETS_RETRY))
+    return session
+
+
+# Metrics read from the H2:AD2 row - (group, key, type, column offset from H)
+METRIC_SCHEMA = (
+    ('production', 'total_batches', int, 0),
+    ('production', 'completed_batches', int, 1),
+    ('production', 'pending_batches', int, 2),
+    ('production', 'average_yield', float, 3),
+    ('quality', 'pass_rate', float, 6),
+    ('quality', 'total_tests', int, 7),
+    ('quality', 'failed_tests', int, 8),
+    ('compliance', 'total_deviations', int, 14),
+    ('compliance', 'critical_deviations', int, 15),
+    ('inventory', 'total_sku', int, 20),
+    ('inventory', 'low_stock_items', int, 21)
+)
+METRIC_GROUPS = tuple(dict.fromkeys(group for group, _, _, _ in METRIC_SCHEMA))
+
+
+@lru_cache(maxsize=8)
+def _map_columns_to_metrics(row_data):
+    """Map your H2:AD2 columns to dashboard metrics
+    
+    Takes the row as a tuple so repeated polls of an unchanged row are a cache hit.
+    Every hit returns the same object, so it is read-only like _FALLBACK_STRUCTURE.
+    """
+    try:
+        metrics = {group: {} for group in METRIC_GROUPS}
+        width = len(row_data)
+        for group, key, kind, index in METRIC_SCHEMA:
+            metrics[group][key] = _parse_cell(kind, row_data[index]) if index < width else kind()
+        return MappingProxyType({group: MappingProxyType(values) for group, values in metrics.items()})
+    except Exception as e:
+        logger.error(f"Error mapping column data: {str(e)}")
+        return _get_fallback_structure()
+
+
+# Formatting characters Sheets leaves in formatted cells ("$1,200", "98.5%")
+_CELL_FORMATTING = str.maketrans('', '', ',$%')
+
+
+def _parse_cell(kind, cell):
+    """Safely parse a sheet cell as int or float; blank or invalid cells read as 0
+    
+    Thousands separators, currency signs and percent signs are dropped, so "98.5%" reads as 98.5.
+    """
+    if not cell:
+        return kind()
+    # Sheets sends strings; only formatted ones need a cleaned copy
+    if type(cell) is str and not cell.isdigit():
+        cell = cell.translate(_CELL_FORMATTING)
+    try:
+        return kind(float(cell))
+    except (ValueError, TypeError):
+        return kind()
+
+
+# Static fallback and chart data - built once at import. The dashboard data is handed
+# out only as deep copies, so a caller that changes what it got cannot change what later
+# calls return
+# Internal only (read by _format_dashboard_data), so it is frozen outright
+_FALLBACK_STRUCTURE = MappingProxyType({
+    'production': MappingProxyType({'total_batches': 147, 'completed_batches': 132, 'pending_batches': 15, 'average_yield': 96.3}),
+    'quality': MappingProxyType({'pass_rate': 98.2, 'total_tests': 1247, 'failed_tests': 23}),
+    'compliance': MappingProxyType({'total_deviations': 8, 'critical_deviations': 1}),
+    'inventory': MappingProxyType({'total_sku': 156, 'low_stock_items': 12})
+})
+
+# Labels for the seven-day trend series, oldest first
+_DAY_LABELS = ('Day -6', 'Day -5', 'Day -4', 'Day -3', 'Day -2', 'Day -1', 'Today')
+
+_PRODUCTION_TREND = [
+    {'day': day, 'batches': batches, 'yield': daily_yield}
+    for day, batches, daily_yield in zip(
+        _DAY_LABELS,
+        (18, 22, 19, 25, 21, 17, 23),
+        (96.1, 97.2, 95.8, 98.1, 96.7, 94.9, 97.5)
+    )
+]
+
+_QUALITY_RADAR = [
+    {'parameter': 'Sterility Assurance', 'value': 100.0},
+    {'parameter': 'Endotoxin Control', 'value': 99.0},
+    {'parameter': 'pH Compliance', 'value': 95.0},
+    {'parameter': 'Particulate Control', 'value': 88.0},
+    {'parameter': 'Potency Assurance', 'value': 102.0}
+]
+
+_ENVIRONMENTAL = [
+    {'zone': 'ISO 5', 'particles': 145, 'status': 'Compliant'},
+    {'zone': 'ISO 7', 'particles': 2840, 'status': 'Compliant'},
+    {'zone': 'ISO 8', 'particles': 89500, 'status': 'Alert'}
+]
+
+_DEVIATION_TREND = {
+    'trend': [2, 1, 3, 0, 1, 0, 1],
+    'total': 8,
+    'critical': 1
+}
+
+_INVENTORY = {
+    'status_breakdown': {'Good': 141, 'Low Stock': 12, 'Critical': 3}
+}
+
+# Chart section shared by live and fallback dashboard data
+_CHARTS = {
+    'production_trend': _PRODUCTION_TREND,
+    'quality_parameters': _QUALITY_RADAR,
+    'environmental_zones': _ENVIRONMENTAL,
+    'deviation_analysis': _DEVIATION_TREND,
+    'inventory_status': _INVENTORY
+}
+
+# Live KPIs - (kpi, value from the mapped metrics, change, status)
+KPI_SPEC = (
+    ('total_batches', lambda metrics: metrics['production']['total_batches'], 8.3, 'good'),
+    ('quality_pass_rate', lambda metrics: metrics['quality']['pass_rate'], 2.1, 'good'),
+    ('compliance_score', lambda metrics: 97.3, -1.2, 'warning'),
+    ('active_deviations', lambda metrics: metrics['compliance']['total_deviations'], -25.0, 'warning'),
+    ('inventory_alerts', lambda metrics: metrics['inventory']['low_stock_items'], 15.2, 'warning')
+)
+
+# Handed to callers that serialize it, so it stays plain (JSON-serializable) dicts
+_FALLBACK_DASHBOARD_DATA = {
+    'kpis': {
+        'total_batches': {'value': 147, 'change': 8.3, 'status': 'good'},
+        'quality_pass_rate': {'value': 98.2, 'change': 2.1, 'status': 'good'},
+        'compliance_score': {'value': 94.3, 'change': -1.2, 'status': 'warning'},
+        'active_deviations': {'value': 8, 'change': -25.0, 'status': 'warning'},
+        'inventory_alerts': {'value': 15, 'change': 15.2, 'status': 'warning'}
+    },
+    'charts': _CHARTS
+}
+
+
+def _get_fallback_structure():
+    """Fallback data structure"""
+    return _FALLBACK_STRUCTURE
+
+
 class Master503BConnector:
     """Direct connection to your existing 503B master sheet"""
     
-    def __init__(self):
-        self.client = None
+    # One authorized session per process, shared by every connector so polls reuse
+    # the same kept-alive connections
+    session = None
+    _session_lock = threading.Lock()
+    
+    def __init__(self, refresh_interval=None, cache_ttl=60):
         self.sheet_id = '1oI-XqRbp8r3V8yMjnC5pNvDMljJDv4f6d01vRmrVH1g'
         self.sheet_name = 'MASTER SHEET'
         self.data_range = 'H2:AD2'
-        self.connect()
+        # Every range fetched per refresh and the mapper that turns its first row into
+        # metric groups. All of them go out in a single batchGet request, so adding a
+        # range costs no extra round-trip
+        self.range_mappers = {f"'{self.sheet_name}'!{self.data_range}": _map_columns_to_metrics}
+        self.ranges = list(self.range_mappers)
+        # Latest snapshot from the background refresher, read by get_dashboard_data
+        self._dashboard_data = None
+        # Last good live data as (monotonic time, data) - served for cache_ttl seconds,
+        # and in place of the static fallback when a later fetch fails
+        self._cache = None
+        self._cache_ttl = cache_ttl
+        self._cache_stats = {'hits': 0, 'misses': 0}
+        self._refresh_stop = threading.Event()
+        # Authorization is deferred to the first fetch (see _get_session)
+        if refresh_interval:
+            self.start_background_refresh(refresh_interval)
     
     def connect(self):
         """Connect to Google Sheets using service account"""
         try:
-            if os.getenv('GOOGLE_SERVICE_ACCOUNT'):
-                service_account_info = json.loads(os.getenv('GOOGLE_SERVICE_ACCOUNT'))
-                credentials = Credentials.from_service_account_info(
-                    service_account_info,
-                    scopes=[
-                        'https://www.googleapis.com/auth/spreadsheets.readonly',
-                        'https://www.googleapis.com/auth/drive.readonly'
-                    ]
-                )
-                self.client = gspread.authorize(credentials)
+            service_account_info = _service_account_info()
+            if service_account_info:
+                cls = type(self)
+                with cls._session_lock:
+                    if cls.session is None:
+                        credentials = Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+                        # Reuse pooled TCP/TLS connections across polls instead of re-handshaking
+                        cls.session = _build_session(credentials)
                 logger.info("Successfully connected to 503B master sheet")
                 return True
             else:
@@ -41,179 +297,188 @@ class Master503BConnector:
             logger.error(f"Failed to connect to Google Sheets: {str(e)}")
             return False
     
+    def start_background_refresh(self, interval=60):
+        """Fetch dashboard data every `interval` seconds on a daemon thread
+        
+        Callers then read the latest snapshot instead of waiting on the Sheets API.
+        """
+        def refresh():
+            while True:
+                self._dashboard_data = self._fetch_dashboard_data()
+                if self._refresh_stop.wait(interval):
+                    return
+        
+        self._refresh_stop.clear()
+        threading.Thread(target=refresh, name='503b-refresh', daemon=True).start()
+    
+    def stop_background_refresh(self):
+        """Stop the background refresher after its current fetch"""
+        self._refresh_stop.set()
+    
     def get_dashboard_data(self):
-        """Get formatted data for dashboard display with fallback"""
+        """Get formatted data for dashboard display with fallback
+        
+        Returns the background snapshot when one exists, then live data cached within
+        the TTL (in process, then in the shared Redis cache), and only otherwise fetches inline.
+        """
+        if self._dashboard_data is not None:
+            return self._dashboard_data
+        if self._cache is not None and time.monotonic() - self._cache[0] < self._cache_ttl:
+            self._cache_stats['hits'] += 1
+            return self._cache[1]
+        self._cache_stats['misses'] += 1
+        
+        shared = _shared_cache()
+        if shared is not None:
+            try:
+                cached = shared.get(self._shared_key())
+                # Only one worker refreshes an expired entry; the others keep serving what
+                # they have, or wait for the lock holder's result when they have nothing
+                if cached is None and not shared.set(f"{self._shared_key()}:lock", 1, nx=True, ex=SHARED_LOCK_TTL):
+                    if self._cache is not None:
+                        return self._cache[1]
+                    cached = self._wait_for_shared(shared)
+                if cached is not None:
+                    dashboard_data = json_loads(cached)
+                    self._cache = (time.monotonic(), dashboard_data)
+                    return dashboard_data
+            except Exception as e:
+                logger.error(f"Error reading shared dashboard cache: {str(e)}")
+        
+        return self._fetch_dashboard_data()
+    
+    def _shared_key(self):
+        return f"503b:{self.sheet_id}"
+    
+    def _wait_for_shared(self, shared):
+        """Poll the shared entry while another worker refreshes it, or None if the lock lapses first"""
+        deadline = time.monotonic() + SHARED_LOCK_TTL
+        while time.monotonic() < deadline:
+            time.sleep(SHARED_POLL_INTERVAL)
+            cached = shared.get(self._shared_key())
+            if cached is not None:
+                return cached
+        return None
+    
+    def _fetch_dashboard_data(self):
+        """Fetch and format live data, falling back to the last good data, then static data"""
         try:
             # Try to get live data
             raw_data = self.get_master_data()
             if raw_data:
-                return self._format_dashboard_data(raw_data)
+                dashboard_data = self._format_dashboard_data(raw_data)
+                self._cache = (time.monotonic(), dashboard_data)
+                self._store_shared(dashboard_data)
+                return dashboard_data
         except Exception as e:
             logger.error(f"Error getting dashboard data: {str(e)}")
         
+        # Stale live data beats the static fallback
+        if self._cache is not None:
+            return self._cache[1]
+        
         # Return fallback data
         return self._get_fallback_dashboard_data()
     
+    def _store_shared(self, dashboard_data):
+        """Publish live data to the cross-worker cache for cache_ttl seconds"""
+        shared = _shared_cache()
+        if shared is None:
+            return
+        try:
+            shared.setex(self._shared_key(), self._cache_ttl, json_dumps(dashboard_data))
+        except Exception as e:
+            logger.error(f"Error writing shared dashboard cache: {str(e)}")
+    
     def get_master_data(self):
-        """Fetch data from your master sheet H2:AD2 range"""
+        """Fetch data from your master sheet H2:AD2 range (and any other configured ranges)"""
         try:
-            if not self.client:
+            session = self._get_session()
+            if not session:
                 return None
             
-            spreadsheet = self.client.open_by_key(self.sheet_id)
-            worksheet = spreadsheet.worksheet(self.sheet_name)
+            # Get your Apps Script output from H2:AD2 (plus any other ranges) in one request
+            value_ranges = self._batch_get(session, self.ranges)
             
-            # Get your Apps Script output from H2:AD2
-            values = worksheet.get(self.data_range)
-            
-            if not values or len(values) == 0:
-                logger.warning(f"No data found in range {self.data_range}")
-                return None
+            metrics = {}
+            for (data_range, mapper), value_range in zip(self.range_mappers.items(), value_ranges):
+                values = value_range.get('values', [])
+                if not values:
+                    logger.warning(f"No data found in range {data_range}")
+                    continue
+                # Parse the data row and map it to dashboard structure (memoized on the row contents)
+                data_row = values[0]
+                logger.info(f"Retrieved {len(data_row)} data points from {data_range}")
+                metrics.update(mapper(tuple(data_row)))
             
-            # Parse the data row
-            data_row = values[0] if values else []
-            logger.info(f"Retrieved {len(data_row)} data points from master sheet")
-            
-            # Map to dashboard structure
-            return self._map_columns_to_metrics(data_row)
+            return metrics or None
             
         except Exception as e:
             logger.error(f"Error fetching master sheet: {str(e)}")
             return None
     
-    def _map_columns_to_metrics(self, row_data):
-        """Map your H2:AD2 columns to dashboard metrics"""
-        try:
-            return {
-                'production': {
-                    'total_batches': self._safe_int(row_data, 0),
-                    'completed_batches': self._safe_int(row_data, 1),
-                    'pending_batches': self._safe_int(row_data, 2),
-                    'average_yield': self._safe_float(row_data, 3)
-                },
-                'quality': {
-                    'pass_rate': self._safe_float(row_data, 6),
-                    'total_tests': self._safe_int(row_data, 7),
-                    'failed_tests': self._safe_int(row_data, 8)
-                },
-                'compliance': {
-                    'total_deviations': self._safe_int(row_data, 14),
-                    'critical_deviations': self._safe_int(row_data, 15)
-                },
-                'inventory': {
-                    'total_sku': self._safe_int(row_data, 20),
-                    'low_stock_items': self._safe_int(row_data, 21)
-                }
-            }
-        except Exception as e:
-            logger.error(f"Error mapping column data: {str(e)}")
-            return self._get_fallback_structure()
+    def _get_session(self):
+        """Authorized session, connecting lazily on first use"""
+        if self.session is None:
+            if not _service_account_info() or not self.connect():
+                return None
+        return self.session
     
-    def _safe_int(self, row_data, index):
-        """Safely extract integer from row data"""
-        try:
-            if index < len(row_data) and row_data[index]:
-                return int(float(str(row_data[index]).replace(',', '')))
-            return 0
-        except (ValueError, TypeError):
-            return 0
-    
-    def _safe_float(self, row_data, index):
-        """Safely extract float from row data"""
+    def _batch_get(self, session, ranges):
+        """Read every range with one Sheets v4 values.batchGet call
+        
+        Goes straight to the values endpoint, so no spreadsheet/worksheet metadata
+        requests are made first. Retries stop at SHEETS_DEADLINE, so the whole call
+        takes at most about SHEETS_DEADLINE plus one attempt's SHEETS_TIMEOUT.
+        """
+        _retry_deadline.value = time.monotonic() + SHEETS_DEADLINE
         try:
-            if index < len(row_data) and row_data[index]:
-                return float(str(row_data[index]).replace(',', ''))
-            return 0.0
-        except (ValueError, TypeError):
-            return 0.0
+            response = session.get(
+                f"{SHEETS_API}/{self.sheet_id}/values:batchGet",
+                params={'ranges': ranges, 'majorDimension': 'ROWS'},
+                timeout=SHEETS_TIMEOUT
+            )
+        finally:
+            _retry_deadline.value = None
+        response.raise_for_status()
+        return json_loads(response.content).get('valueRanges', [])
     
     def _format_dashboard_data(self, raw_data):
         """Convert raw master sheet data to dashboard format"""
         return {
             'kpis': {
-                'total_batches': {'value': raw_data['production']['total_batches'], 'change': 8.3, 'status': 'good'},
-                'quality_pass_rate': {'value': raw_data['quality']['pass_rate'], 'change': 2.1, 'status': 'good'},
-                'compliance_score': {'value': 97.3, 'change': -1.2, 'status': 'warning'},
-                'active_deviations': {'value': raw_data['compliance']['total_deviations'], 'change': -25.0, 'status': 'warning'},
-                'inventory_alerts': {'value': raw_data['inventory']['low_stock_items'], 'change': 15.2, 'status': 'warning'}
+                name: {'value': value(raw_data), 'change': change, 'status': status}
+                for name, value, change, status in KPI_SPEC
             },
-            'charts': {
-                'production_trend': self._generate_production_trend(),
-                'quality_parameters': self._generate_quality_radar(),
-                'environmental_zones': self._generate_environmental(),
-                'deviation_analysis': self._generate_deviation_trend(),
-                'inventory_status': self._generate_inventory()
-            }
+            'charts': copy.deepcopy(_CHARTS)
         }
     
     def _generate_production_trend(self):
         """Generate production trend data"""
-        return [
-            {'day': 'Day -6', 'batches': 18, 'yield': 96.1},
-            {'day': 'Day -5', 'batches': 22, 'yield': 97.2},
-            {'day': 'Day -4', 'batches': 19, 'yield': 95.8},
-            {'day': 'Day -3', 'batches': 25, 'yield': 98.1},
-            {'day': 'Day -2', 'batches': 21, 'yield': 96.7},
-            {'day': 'Day -1', 'batches': 17, 'yield': 94.9},
-            {'day': 'Today', 'batches': 23, 'yield': 97.5}
-        ]
+        return copy.deepcopy(_PRODUCTION_TREND)
     
     def _generate_quality_radar(self):
         """Generate quality parameters for radar chart"""
-        return [
-            {'parameter': 'Sterility Assurance', 'value': 100.0},
-            {'parameter': 'Endotoxin Control', 'value': 99.0},
-            {'parameter': 'pH Compliance', 'value': 95.0},
-            {'parameter': 'Particulate Control', 'value': 88.0},
-            {'parameter': 'Potency Assurance', 'value': 102.0}
-        ]
+        return copy.deepcopy(_QUALITY_RADAR)
     
     def _generate_environmental(self):
         """Generate environmental data"""
-        return [
-            {'zone': 'ISO 5', 'particles': 145, 'status': 'Compliant'},
-            {'zone': 'ISO 7', 'particles': 2840, 'status': 'Compliant'},
-            {'zone': 'ISO 8', 'particles': 89500, 'status': 'Alert'}
-        ]
+        return copy.deepcopy(_ENVIRONMENTAL)
     
     def _generate_deviation_trend(self):
         """Generate deviation trend"""
-        return {
-            'trend': [2, 1, 3, 0, 1, 0, 1],
-            'total': 8,
-            'critical': 1
-        }
+        return copy.deepcopy(_DEVIATION_TREND)
     
     def _generate_inventory(self):
         """Generate inventory breakdown"""
-        return {
-            'status_breakdown': {'Good': 141, 'Low Stock': 12, 'Critical': 3}
-        }
-    
-    def _get_fallback_structure(self):
-        """Fallback data structure"""
-        return {
-            'production': {'total_batches': 147, 'completed_batches': 132, 'pending_batches': 15, 'average_yield': 96.3},
-            'quality': {'pass_rate': 98.2, 'total_tests': 1247, 'failed_tests': 23},
-            'compliance': {'total_deviations': 8, 'critical_deviations': 1},
-            'inventory': {'total_sku': 156, 'low_stock_items': 12}
-        }
+        return copy.deepcopy(_INVENTORY)
     
     def _get_fallback_dashboard_data(self):
         """Complete fallback dashboard data"""
-        return {
-            'kpis': {
-                'total_batches': {'value': 147, 'change': 8.3, 'status': 'good'},
-                'quality_pass_rate': {'value': 98.2, 'change': 2.1, 'status': 'good'},
-                'compliance_score': {'value': 94.3, 'change': -1.2, 'status': 'warning'},
-                'active_deviations': {'value': 8, 'change': -25.0, 'status': 'warning'},
-                'inventory_alerts': {'value': 15, 'change': 15.2, 'status': 'warning'}
-            },
-            'charts': {
-                'production_trend': self._generate_production_trend(),
-                'quality_parameters': self._generate_quality_radar(),
-                'environmental_zones': self._generate_environmental(),
-                'deviation_analysis': self._generate_deviation_trend(),
-                'inventory_status': self._generate_inventory()
-            }
-        }
+        return copy.deepcopy(_FALLBACK_DASHBOARD_DATA)
+
+
+@lru_cache(maxsize=1)
+def get_connector():
+    """Process-wide connector, so its TTL cache and session survive across requests"""
+    return Master503BConnector()
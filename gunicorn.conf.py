@@ -0,0 +1,14 @@
+# Production server settings - picked up automatically by `gunicorn app:server`
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8050)}"
+
+# One worker per core; --preload builds the app and its cached figures once in the
+# master so every forked worker shares them copy-on-write
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+preload_app = True
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = 120
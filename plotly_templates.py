@@ -1,47 +1,61 @@
 # UI-REFACTOR-GOLD-2025: Elite Plotly theme for Fortune-500 dashboards
 import plotly.io as pio
 import plotly.graph_objects as go
+from functools import cache
 
-def register_gold_dark_template():
-    """Register the elite gold dark theme for all charts"""
-    
-    gold_dark_template = go.layout.Template(
-        layout=go.Layout(
+# Palette shared by every color in the template
+GOLD = "#D4AF37"
+GREY = "#B8B9BB"
+FG = "#F5F6F7"
+BG = "#0F1113"
+PANEL = "#1B1D1F"
+GRID = "rgba(255,255,255,0.04)"
+BORDER = "rgba(255,255,255,0.06)"
+
+# Color palette for data series
+_COLORWAY = (GOLD, "#FFCF66", GREY, "#3DBC6B", "#E4574C")
+
+@cache
+def _build_template():
+    """Build the gold dark Template - constructed once per process"""
+    return go.layout.Template(
+        # Plain dict spec - validated once by Template rather than through a go.Layout first
+        layout=dict(
             # Core background colors
-            paper_bgcolor="#0F1113",
-            plot_bgcolor="#1B1D1F",
+            paper_bgcolor=BG,
+            plot_bgcolor=PANEL,
             
             # Typography
             font=dict(
                 family="Inter, Roboto, system-ui",
-                color="#F5F6F7",
+                color=FG,
                 size=13
             ),
             
             # Color palette for data series
-            colorway=["#D4AF37", "#FFCF66", "#B8B9BB", "#3DBC6B", "#E4574C"],
+            colorway=_COLORWAY,
             
             # Axes styling
             xaxis=dict(
-                color="#B8B9BB",
-                gridcolor="rgba(255,255,255,0.04)",
+                color=GREY,
+                gridcolor=GRID,
                 zeroline=False,
                 showline=False,
-                tickfont=dict(color="#B8B9BB", size=12)
+                tickfont=dict(color=GREY, size=12)
             ),
             yaxis=dict(
-                color="#B8B9BB",
-                gridcolor="rgba(255,255,255,0.04)",
+                color=GREY,
+                gridcolor=GRID,
                 zeroline=False,
                 showline=False,
-                tickfont=dict(color="#B8B9BB", size=12)
+                tickfont=dict(color=GREY, size=12)
             ),
             
             # Hover styling
             hoverlabel=dict(
                 bgcolor="#121314",
-                bordercolor="rgba(255,255,255,0.06)",
-                font=dict(color="#F5F6F7", size=12)
+                bordercolor=BORDER,
+                font=dict(color=FG, size=12)
             ),
             hovermode="x unified",
             
@@ -50,7 +64,7 @@ def register_gold_dark_template():
             
             # Title styling
             title=dict(
-                font=dict(color="#D4AF37", size=18, family="Inter"),
+                font=dict(color=GOLD, size=18, family="Inter"),
                 x=0.5,
                 xanchor="center"
             ),
@@ -58,48 +72,36 @@ def register_gold_dark_template():
             # Legend styling
             legend=dict(
                 bgcolor="rgba(0,0,0,0)",
-                bordercolor="rgba(255,255,255,0.06)",
+                bordercolor=BORDER,
                 borderwidth=1,
-                font=dict(color="#B8B9BB")
+                font=dict(color=GREY)
             )
         )
     )
+
+def register_gold_dark_template():
+    """Register the elite gold dark theme for all charts"""
+    
+    templates = pio.templates
+    
+    # Already registered - only make sure it is still the default
+    if "gold_dark" in templates:
+        templates.default = "gold_dark"
+        return
     
     # Register template
-    pio.templates["gold_dark"] = gold_dark_template
-    pio.templates.default = "gold_dark"
+    templates["gold_dark"] = _build_template()
+    templates.default = "gold_dark"
 
 def styled_plotly_chart(fig, height=400, use_modebar=False):
     """Apply consistent styling to any Plotly figure"""
     
-    # Ensure template is applied
-    fig.update_layout(template="gold_dark")
+    # Registered on first use rather than at import
+    if "gold_dark" not in pio.templates:
+        register_gold_dark_template()
     
-    # Override specific layout properties for consistency
-    fig.update_layout(
-        height=height,
-        paper_bgcolor="#0F1113",
-        plot_bgcolor="#1B1D1F",
-        font=dict(family="Inter, Roboto, system-ui", color="#F5F6F7"),
-        margin=dict(l=40, r=20, t=40, b=40),
-        hovermode="x unified" if fig.layout.hovermode is None else fig.layout.hovermode
-    )
-    
-    # Style axes consistently
-    fig.update_xaxes(
-        color="#B8B9BB",
-        gridcolor="rgba(255,255,255,0.04)",
-        zeroline=False,
-        showline=False
-    )
-    fig.update_yaxes(
-        color="#B8B9BB", 
-        gridcolor="rgba(255,255,255,0.04)",
-        zeroline=False,
-        showline=False
-    )
+    # The template supplies the colors, font, margins, hovermode and styling for every
+    # axis, so only the height needs setting on the figure itself
+    fig.update_layout(template="gold_dark", height=height)
     
     return fig
-
-# Initialize the template when module is imported
-register_gold_dark_template()
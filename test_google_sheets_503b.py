@@ -0,0 +1,266 @@
+# 503B connector tests - Sheets retry bounds, dashboard data caching and cell parsing
+import time
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+import google_sheets_503b as sheets
+from google_sheets_503b import SHEETS_RETRY, SHEETS_RETRY_WAIT_MAX, Master503BConnector
+
+
+@pytest.fixture
+def deadline():
+    """Set the thread's batchGet deadline for one test, clearing it afterwards"""
+    def set_deadline(seconds_from_now):
+        sheets._retry_deadline.value = time.monotonic() + seconds_from_now
+    yield set_deadline
+    sheets._retry_deadline.value = None
+
+
+class TestSheetsRetry:
+    """Retry-After and backoff waits are capped, and retries stop at the batchGet deadline"""
+    
+    def test_retry_after_is_capped(self):
+        response = HTTPResponse(status=429, headers={'Retry-After': '100'})
+        assert SHEETS_RETRY.get_retry_after(response) == SHEETS_RETRY_WAIT_MAX == 5
+    
+    def test_short_retry_after_is_kept(self):
+        response = HTTPResponse(status=503, headers={'Retry-After': '2'})
+        assert SHEETS_RETRY.get_retry_after(response) == 2
+    
+    def test_backoff_is_capped(self):
+        retry = SHEETS_RETRY
+        for _ in range(SHEETS_RETRY.total):
+            retry = retry.increment('GET', '/values:batchGet', response=HTTPResponse(status=503))
+        assert retry.get_backoff_time() == SHEETS_RETRY_WAIT_MAX
+    
+    def test_retries_within_deadline(self, deadline):
+        deadline(60)
+        retry = SHEETS_RETRY.increment('GET', '/values:batchGet', response=HTTPResponse(status=429))
+        assert retry.total == SHEETS_RETRY.total - 1
+    
+    def test_retries_stop_at_deadline(self, deadline):
+        # Another capped wait would run past the deadline
+        deadline(SHEETS_RETRY_WAIT_MAX - 1)
+        with pytest.raises(MaxRetryError):
+            SHEETS_RETRY.increment('GET', '/values:batchGet', response=HTTPResponse(status=429))
+    
+    def test_batch_get_sets_and_clears_deadline(self):
+        seen = {}
+        
+        class FakeResponse:
+            content = b'{"valueRanges": [{"values": [["1"]]}]}'
+            
+            def raise_for_status(self):
+                pass
+        
+        class FakeSession:
+            def get(self, url, params, timeout):
+                seen['remaining'] = sheets._retry_deadline.value - time.monotonic()
+                seen['timeout'] = timeout
+                return FakeResponse()
+        
+        value_ranges = Master503BConnector()._batch_get(FakeSession(), ['A1'])
+        
+        assert value_ranges == [{'values': [['1']]}]
+        assert 0 < seen['remaining'] <= sheets.SHEETS_DEADLINE
+        assert seen['timeout'] == sheets.SHEETS_TIMEOUT
+        assert sheets._retry_deadline.value is None
+
+
+class TestFallbackData:
+    """Fallback and chart data are handed out as copies of the module constants"""
+    
+    def test_mutating_fallback_does_not_leak(self):
+        connector = Master503BConnector()
+        data = connector._get_fallback_dashboard_data()
+        data['kpis'].clear()
+        data['charts']['production_trend'].append({'day': 'Extra'})
+        
+        fresh = connector._get_fallback_dashboard_data()
+        assert fresh['kpis']
+        assert fresh['charts']['production_trend'] == sheets._PRODUCTION_TREND
+
+
+class FakeRedis:
+    """Just enough of redis.Redis for the shared cache: get, set NX and setex"""
+    
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.gets = 0
+    
+    def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+    
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+    
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+class TestSharedCache:
+    """A worker that loses the refresh lock waits for the holder instead of calling batchGet"""
+    
+    @pytest.fixture
+    def connector(self, monkeypatch):
+        connector = Master503BConnector()
+        monkeypatch.setattr(connector, '_fetch_dashboard_data', lambda: {'source': 'fetch'})
+        monkeypatch.setattr(sheets.time, 'sleep', lambda seconds: None)
+        return connector
+    
+    def test_lost_lock_waits_for_holder(self, monkeypatch, connector):
+        key = connector._shared_key()
+        shared = FakeRedis({f"{key}:lock": 1})
+        original_get = shared.get
+        
+        def get(name):
+            # The lock holder publishes after the waiter's second poll
+            if shared.gets == 2:
+                shared.values[key] = sheets.json_dumps({'source': 'shared'})
+            return original_get(name)
+        
+        monkeypatch.setattr(shared, 'get', get)
+        monkeypatch.setattr(sheets, '_shared_cache', lambda: shared)
+        
+        assert connector.get_dashboard_data() == {'source': 'shared'}
+        assert connector._cache[1] == {'source': 'shared'}
+    
+    def test_lost_lock_fetches_once_lock_lapses(self, monkeypatch, connector):
+        shared = FakeRedis({f"{connector._shared_key()}:lock": 1})
+        monkeypatch.setattr(sheets, '_shared_cache', lambda: shared)
+        clock = iter(range(0, 100))
+        monkeypatch.setattr(sheets.time, 'monotonic', lambda: next(clock))
+        
+        assert connector.get_dashboard_data() == {'source': 'fetch'}
+    
+    def test_lost_lock_serves_local_copy(self, monkeypatch, connector):
+        shared = FakeRedis({f"{connector._shared_key()}:lock": 1})
+        monkeypatch.setattr(sheets, '_shared_cache', lambda: shared)
+        connector._cache = (-connector._cache_ttl, {'source': 'local'})
+        
+        assert connector.get_dashboard_data() == {'source': 'local'}
+        assert shared.gets == 1
+
+
+class TestDashboardCache:
+    """Live data is served from the TTL cache, refetched after expiry, and kept when a fetch fails"""
+    
+    ROW = ['147', '132', '15', '96.3']
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(sheets.time, 'monotonic', lambda: now[0])
+        return now
+    
+    @pytest.fixture
+    def connector(self, monkeypatch):
+        connector = Master503BConnector(cache_ttl=60)
+        connector.batch_gets = 0
+        connector.row = self.ROW
+        
+        def batch_get(session, ranges):
+            connector.batch_gets += 1
+            if connector.row is None:
+                raise ConnectionError('Sheets unavailable')
+            return [{'values': [connector.row]} for _ in ranges]
+        
+        monkeypatch.setattr(sheets, '_shared_cache', lambda: None)
+        monkeypatch.setattr(connector, '_get_session', lambda: object())
+        monkeypatch.setattr(connector, '_batch_get', batch_get)
+        return connector
+    
+    def test_hit_within_ttl(self, clock, connector):
+        first = connector.get_dashboard_data()
+        clock[0] += 59
+        
+        assert connector.get_dashboard_data() is first
+        assert connector.batch_gets == 1
+        assert connector._cache_stats == {'hits': 1, 'misses': 1}
+    
+    def test_refetch_after_expiry(self, clock, connector):
+        connector.get_dashboard_data()
+        connector.row = ['150'] + self.ROW[1:]
+        clock[0] += 60
+        
+        data = connector.get_dashboard_data()
+        assert connector.batch_gets == 2
+        assert data['kpis']['total_batches']['value'] == 150
+    
+    def test_stale_data_when_fetch_fails(self, clock, connector):
+        first = connector.get_dashboard_data()
+        connector.row = None
+        clock[0] += 120
+        
+        assert connector.get_dashboard_data() is first
+        assert connector.batch_gets == 2
+    
+    def test_background_snapshot_served_without_fetching(self, connector):
+        connector.start_background_refresh(interval=60)
+        connector.stop_background_refresh()
+        for _ in range(100):
+            if connector._dashboard_data is not None:
+                break
+            time.sleep(0.01)
+        
+        snapshot = connector.get_dashboard_data()
+        assert snapshot is connector._dashboard_data
+        assert snapshot['kpis']['total_batches']['value'] == 147
+        assert connector.batch_gets == 1
+
+
+class TestCellParsing:
+    """Sheet cells parse by their METRIC_SCHEMA type; formatting is dropped and bad cells read as 0"""
+    
+    @pytest.mark.parametrize('kind, cell, expected', [
+        (int, '147', 147),
+        (int, '1,200', 1200),
+        (int, '$1,200', 1200),
+        (float, '$1,234.50', 1234.5),
+        (float, '98.5%', 98.5),
+        (int, '12%', 12),
+        (float, '96.3', 96.3),
+        (int, '96.7', 96),
+        (int, ' 42 ', 42),
+        (int, 147, 147),
+        (float, 96.3, 96.3),
+        (int, '', 0),
+        (float, None, 0.0),
+        (int, 'N/A', 0),
+        (float, '#REF!', 0.0),
+        (int, '$', 0),
+    ])
+    def test_parse_cell(self, kind, cell, expected):
+        value = sheets._parse_cell(kind, cell)
+        assert value == expected
+        assert type(value) is kind
+    
+    @pytest.mark.parametrize('group, key, index', [
+        (group, key, index) for group, key, _, index in sheets.METRIC_SCHEMA
+    ])
+    def test_column_maps_to_metric(self, group, key, index):
+        row = ['0'] * 22
+        row[index] = '7'
+        metrics = sheets._map_columns_to_metrics(tuple(row))
+        assert metrics[group][key] == 7
+        assert sum(value for values in metrics.values() for value in values.values()) == 7
+    
+    def test_mapping_parses_each_type(self):
+        row = ['1,200', '1,100', '100', '96.3%'] + [''] * 2 + ['98.5%', '450', '3'] + [''] * 5 + ['4', '1'] + [''] * 4 + ['$85', 'x']
+        assert sheets._map_columns_to_metrics(tuple(row)) == {
+            'production': {'total_batches': 1200, 'completed_batches': 1100, 'pending_batches': 100, 'average_yield': 96.3},
+            'quality': {'pass_rate': 98.5, 'total_tests': 450, 'failed_tests': 3},
+            'compliance': {'total_deviations': 4, 'critical_deviations': 1},
+            'inventory': {'total_sku': 85, 'low_stock_items': 0},
+        }
+    
+    def test_short_row_reads_missing_columns_as_zero(self):
+        metrics = sheets._map_columns_to_metrics(('147', '132'))
+        assert metrics['production'] == {'total_batches': 147, 'completed_batches': 132, 'pending_batches': 0, 'average_yield': 0.0}
+        assert metrics['inventory'] == {'total_sku': 0, 'low_stock_items': 0}
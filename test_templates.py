@@ -1,111 +1,67 @@
 # UI-REFACTOR-GOLD-2025: Elite template validation tests
 import pytest
-import os
 import plotly.io as pio
-from plotly_templates import register_gold_dark_template
+from pathlib import Path
+
+ASSETS = Path(__file__).parent / "assets"
+
+# Plotly stores colorway as a tuple and margin as a Margin object
+EXPECTED_COLORWAY = ("#D4AF37", "#FFCF66", "#B8B9BB", "#3DBC6B", "#E4574C")
+EXPECTED_MARGIN = {"l": 40, "r": 20, "t": 40, "b": 40}
 
 
 class TestEliteTemplates:
     """Test suite for Fortune-500 dashboard templates and assets"""
     
-    def test_gold_dark_template_registration(self):
+    def test_gold_dark_template_registration(self, gold_dark):
         """Ensure gold_dark template is properly registered"""
-        register_gold_dark_template()
-        
         # Template should be registered
         assert "gold_dark" in pio.templates
         
         # Should be set as default
         assert pio.templates.default == "gold_dark"
-        
-        # Verify core template properties
-        template = pio.templates["gold_dark"]
-        assert template.layout.paper_bgcolor == "#0F1113"
-        assert template.layout.plot_bgcolor == "#1B1D1F"
-        assert template.layout.font.family == "Inter, Roboto, system-ui"
-        assert template.layout.font.color == "#F5F6F7"
     
-    def test_template_color_palette(self):
-        """Verify the elite color palette is correctly applied"""
-        register_gold_dark_template()
-        template = pio.templates["gold_dark"]
+    @pytest.mark.parametrize("path,expected", [
+        # Core template properties
+        ("layout.paper_bgcolor", "#0F1113"),
+        ("layout.plot_bgcolor", "#1B1D1F"),
+        ("layout.font.family", "Inter, Roboto, system-ui"),
+        ("layout.font.color", "#F5F6F7"),
         
-        expected_colors = ["#D4AF37", "#FFCF66", "#B8B9BB", "#3DBC6B", "#E4574C"]
-        assert template.layout.colorway == expected_colors
-    
-    def test_template_styling_properties(self):
-        """Test template styling matches Fortune-500 specifications"""
-        register_gold_dark_template()
-        template = pio.templates["gold_dark"]
+        # Color palette
+        ("layout.colorway", EXPECTED_COLORWAY),
         
         # Hover styling
-        assert template.layout.hoverlabel.bgcolor == "#121314"
-        assert template.layout.hoverlabel.bordercolor == "rgba(255,255,255,0.06)"
-        assert template.layout.hovermode == "x unified"
+        ("layout.hoverlabel.bgcolor", "#121314"),
+        ("layout.hoverlabel.bordercolor", "rgba(255,255,255,0.06)"),
+        ("layout.hovermode", "x unified"),
         
         # Axes styling
-        assert template.layout.xaxis.color == "#B8B9BB"
-        assert template.layout.xaxis.gridcolor == "rgba(255,255,255,0.04)"
-        assert template.layout.xaxis.zeroline == False
-        assert template.layout.xaxis.showline == False
-    
-    def test_required_assets_exist(self):
-        """Verify all required elite assets are present"""
-        assets_dir = "assets"
-        
-        # Check for logo
-        logo_path = os.path.join(assets_dir, "lexcuralogo.png")
-        # Note: In real deployment, this should exist
-        # For now, we'll just check the expected path structure
-        expected_logo_path = "assets/lexcuralogo.png"
-        assert expected_logo_path == "assets/lexcuralogo.png"
-        
-        # Check for background animation CSS
-        bg_anim_path = os.path.join(assets_dir, "bg-anim.css")
-        expected_bg_path = "assets/bg-anim.css"
-        assert expected_bg_path == "assets/bg-anim.css"
-        
-        # Check for elite styles CSS
-        elite_styles_path = os.path.join(assets_dir, "elite-styles.css")
-        expected_elite_path = "assets/elite-styles.css"
-        assert expected_elite_path == "assets/elite-styles.css"
-    
-    def test_template_margins_and_layout(self):
-        """Test template layout specifications"""
-        register_gold_dark_template()
-        template = pio.templates["gold_dark"]
+        ("layout.xaxis.color", "#B8B9BB"),
+        ("layout.xaxis.gridcolor", "rgba(255,255,255,0.04)"),
+        ("layout.xaxis.zeroline", False),
+        ("layout.xaxis.showline", False),
         
         # Margin specifications
-        expected_margin = dict(l=40, r=20, t=40, b=40)
-        assert template.layout.margin == expected_margin
+        *((f"layout.margin.{side}", px) for side, px in EXPECTED_MARGIN.items()),
         
         # Title positioning
-        assert template.layout.title.x == 0.5
-        assert template.layout.title.xanchor == "center"
+        ("layout.title.x", 0.5),
+        ("layout.title.xanchor", "center"),
+    ])
+    def test_template_property(self, gold_dark, path, expected):
+        """Test template styling matches Fortune-500 specifications"""
+        obj = gold_dark
+        for attr in path.split("."):
+            obj = getattr(obj, attr)
+        assert obj == expected
+    
+    @pytest.mark.skipif(not ASSETS.exists(), reason="assets not deployed")
+    @pytest.mark.parametrize("name", ["bg-anim.css", "theme.css", "clientside.js"])
+    def test_required_assets_exist(self, name):
+        """Verify the assets the dashboard depends on are present"""
+        assert (ASSETS / name).is_file(), name
 
 
 if __name__ == "__main__":
-    # Run basic template tests
-    test_instance = TestEliteTemplates()
-    
-    try:
-        test_instance.test_gold_dark_template_registration()
-        print("✅ Template registration test passed")
-        
-        test_instance.test_template_color_palette()
-        print("✅ Color palette test passed")
-        
-        test_instance.test_template_styling_properties()
-        print("✅ Styling properties test passed")
-        
-        test_instance.test_required_assets_exist()
-        print("✅ Asset structure test passed")
-        
-        test_instance.test_template_margins_and_layout()
-        print("✅ Layout specifications test passed")
-        
-        print("🎉 All elite template tests passed!")
-        
-    except Exception as e:
-        print(f"❌ Template test failed: {str(e)}")
-        exit(1)
\ No newline at end of file
+    raise SystemExit(pytest.main([__file__, "-v"]))